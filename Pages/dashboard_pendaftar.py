@@ -1,7 +1,15 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 
+from gik.analytics.pendaftar import (
+    GRANULARITIES, build_cube, build_sql_table, build_timeline, date_bounds, distribution_tables,
+    filter_options, hour_table, hourly_counts, kpis, peak_hour, semester_insight, trend_table
+)
+from gik.datasets import SEMESTER_COL, load_pendaftar
+from gik.instrument import Recorder, computes, stage
+from gik.sqlstore import USE_SQL
+from gik.ui import debug_panel
+
 # ==================================================
 # PAGE CONFIG
 # ==================================================
@@ -10,6 +18,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Pencatat waktu per tahap untuk rerun ini (lihat gik/instrument.py)
+recorder = Recorder("dashboard_pendaftar")
+
 # ==================================================
 # GLOBAL VISUAL STYLE
 # ==================================================
@@ -75,44 +86,51 @@ st.markdown(
 # ==================================================
 # LOAD DATA
 # ==================================================
-@st.cache_data
+@st.cache_resource
+@computes
 def load_data():
-    df = pd.read_csv("data/data_pendaftar.csv")
-    df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-    return df
-
-df = load_data()
-
-# ==================================================
-# DATA CLEANING (LOGIC UNCHANGED)
-# ==================================================
-def clean_text(series):
-    return series.astype(str).str.strip().str.lower()
-
-df['Asal Instansi'] = clean_text(df['Asal Instansi'])
-df['Jenjang pendidikan asal'] = clean_text(df['Jenjang pendidikan asal'])
-df['Jenis kelamin'] = clean_text(df['Jenis kelamin'])
-
-semester_col = (
-    'Semester kuliah bagi mahasiswa aktif ketika mengikuti Program '
-    'GIKnowledge Building (di semester ganjil tahun ajaran 2025/2026)?'
-)
-df[semester_col] = clean_text(df[semester_col])
-
-def normalize_instansi(name):
-    if "gadjah" in name or "ugm" in name:
-        return "Universitas Gadjah Mada"
-    if "upn" in name:
-        return "UPN Veteran Yogyakarta"
-    if "sunan kalijaga" in name or "uin" in name:
-        return "Universitas Islam Negeri Sunan Kalijaga"
-    if "amikom" in name:
-        return "Universitas Amikom Yogyakarta"
-    if "uty" in name or "teknologi yogyakarta" in name:
-        return "Universitas Teknologi Yogyakarta"
-    return name.title()
-
-df['Asal Instansi'] = df['Asal Instansi'].apply(normalize_instansi)
+    # Satu DataFrame read-only (memory-mapped) dibagi semua sesi; jangan dimutasi.
+    # Cleaning & normalisasi instansi sudah dilakukan saat membangun cache Arrow
+    return load_pendaftar()
+
+with stage("load", cached=True) as record:
+    df = load_data()
+    record["rows"] = len(df)
+semester_col = SEMESTER_COL
+
+@st.cache_resource
+@computes
+def get_sql_table():
+    # GIK_BACKEND=sqlite: tabel pendaftar di SQLite lokal dengan indeks (kolom filter, hari)
+    return build_sql_table(load_data())
+
+@st.cache_resource
+@computes
+def get_timeline():
+    # Timestamp terurut (int64 ns) + jumlah per jam
+    if USE_SQL:
+        return get_sql_table().timeline()
+    return build_timeline(load_data())
+
+@st.cache_resource
+@computes
+def get_count_cube():
+    # Jumlah pendaftar per (jam, instansi, jenjang, gender, semester), dibangun sekali.
+    # Backend SQL: setiap agregat menjadi query GROUP BY berparameter dengan API yang sama
+    if USE_SQL:
+        return get_sql_table()
+    return build_cube(load_data(), get_timeline())
+
+@st.cache_resource(max_entries=64)
+@computes
+def get_hourly_counts(selection_items):
+    # Array jumlah per jam per kombinasi filter; tren semua granularitas, hari & jam tersibuk dibaca dari sini
+    return hourly_counts(get_count_cube(), get_timeline(), dict(selection_items))
+
+def get_options(col):
+    if USE_SQL:
+        return get_sql_table().options(col)
+    return filter_options(df, col)
 
 # ==================================================
 # SIDEBAR FILTER
@@ -121,9 +139,8 @@ st.sidebar.title("🎛️ Filter Data")
 st.sidebar.caption("Gunakan filter untuk mengeksplorasi data pendaftar")
 
 if st.sidebar.button("🔄 Reset All Filter"):
-    min_date = df['Timestamp'].dt.date.min()
-    max_date = df['Timestamp'].dt.date.max()
-    st.session_state['date_range'] = (min_date, max_date)
+    timeline = get_timeline()
+    st.session_state['date_range'] = (timeline.min_date, timeline.max_date)
     st.session_state['instansi_selected'] = "Semua"
     st.session_state['jenjang_selected'] = "Semua"
     st.session_state['gender_selected'] = "Semua"
@@ -132,8 +149,10 @@ if st.sidebar.button("🔄 Reset All Filter"):
 
 st.sidebar.divider()
 
-min_date = df['Timestamp'].dt.date.min()
-max_date = df['Timestamp'].dt.date.max()
+with stage("timeline", cached=True):
+    timeline = get_timeline()
+min_date = timeline.min_date
+max_date = timeline.max_date
 
 if "date_range" not in st.session_state:
     st.session_state["date_range"] = (min_date, max_date)
@@ -164,10 +183,10 @@ if date_start > date_end:
     st.sidebar.warning("⚠️ Tanggal awal lebih besar dari tanggal akhir. Rentang direset.")
     date_start, date_end = min_date, max_date
 
-instansi_list = ["Semua"] + sorted(df['Asal Instansi'].unique())
-jenjang_list = ["Semua"] + sorted(df['Jenjang pendidikan asal'].unique())
-gender_list = ["Semua"] + sorted(df['Jenis kelamin'].unique())
-semester_list = ["Semua"] + sorted(df[semester_col].unique())
+instansi_list = ["Semua"] + get_options('Asal Instansi')
+jenjang_list = ["Semua"] + get_options('Jenjang pendidikan asal')
+gender_list = ["Semua"] + get_options('Jenis kelamin')
+semester_list = ["Semua"] + get_options(semester_col)
 
 instansi_selected = st.sidebar.selectbox("🏫 Asal Instansi", instansi_list, key="instansi_selected")
 jenjang_selected = st.sidebar.selectbox("🎓 Jenjang Pendidikan", jenjang_list, key="jenjang_selected")
@@ -175,26 +194,33 @@ gender_selected = st.sidebar.selectbox("👥 Jenis Kelamin", gender_list, key="g
 semester_selected = st.sidebar.selectbox("📚 Semester / Angkatan", semester_list, key="semester_selected")
 
 # ==================================================
-# APPLY FILTER (UNCHANGED)
+# APPLY FILTER (COUNT CUBE)
 # ==================================================
-filtered_df = df.copy()
-
-filtered_df = filtered_df[
-    (filtered_df['Timestamp'].dt.date >= date_start) &
-    (filtered_df['Timestamp'].dt.date <= date_end)
-]
+selections = {}
+between = date_bounds(date_start, date_end)
 
 if instansi_selected != "Semua":
-    filtered_df = filtered_df[filtered_df['Asal Instansi'] == instansi_selected]
+    selections['Asal Instansi'] = instansi_selected
 
 if jenjang_selected != "Semua":
-    filtered_df = filtered_df[filtered_df['Jenjang pendidikan asal'] == jenjang_selected]
+    selections['Jenjang pendidikan asal'] = jenjang_selected
 
 if gender_selected != "Semua":
-    filtered_df = filtered_df[filtered_df['Jenis kelamin'] == gender_selected]
+    selections['Jenis kelamin'] = gender_selected
 
 if semester_selected != "Semua":
-    filtered_df = filtered_df[filtered_df[semester_col] == semester_selected]
+    selections[semester_col] = semester_selected
+
+# Semua grafik & KPI dijumlahkan dari sel kubus yang lolos filter, bukan dari baris mentah.
+# Rentang tanggal = binary search pada sel yang terurut per jam.
+with stage("count_cube", cached=True):
+    cube = get_count_cube()
+
+# Deret per jam (tanpa filter kategori langsung pakai timeline); harian diturunkan darinya
+with stage("filter", cached=True):
+    hourly = get_hourly_counts(tuple(selections.items()))
+    daily = hourly.daily()
+    hours = hour_table(hourly, date_start, date_end)
 
 # ==================================================
 # HEADER
@@ -209,29 +235,29 @@ st.divider()
 # ==================================================
 # KPI
 # ==================================================
-total_pendaftar = filtered_df.shape[0]
+summary = kpis(cube, daily, selections, date_start, date_end)
+total_pendaftar = summary["total_pendaftar"]
+instansi_terbanyak = summary["instansi_terbanyak"]
+hari_terpadat = summary["hari_terpadat"]
+jam_tersibuk = peak_hour(hours)["jam_tersibuk"]
 
-if total_pendaftar > 0:
-    instansi_terbanyak = filtered_df['Asal Instansi'].value_counts().idxmax()
-    hari_terpadat = filtered_df['Timestamp'].dt.date.value_counts().idxmax()
-else:
-    instansi_terbanyak = "-"
-    hari_terpadat = "-"
-
-k1, k2, k3 = st.columns(3)
+k1, k2, k3, k4 = st.columns(4)
 k1.metric("👥 Total Pendaftar", f"{total_pendaftar}")
 k2.metric("🏫 Instansi Terbanyak", instansi_terbanyak)
 k3.metric("📅 Hari Terpadat", str(hari_terpadat))
+k4.metric("⏰ Jam Tersibuk", jam_tersibuk)
 
 st.divider()
 
 # ==================================================
 # ROW 1 – GENDER & JENJANG
 # ==================================================
+# Tabel jumlah & persentase untuk semua grafik (lihat gik/analytics/pendaftar.py)
+tables = distribution_tables(cube, selections, between)
+
 col1, col2 = st.columns(2)
 
-gender_count = filtered_df['Jenis kelamin'].value_counts().reset_index()
-gender_count.columns = ['Jenis Kelamin', 'Jumlah']
+gender_count = tables["gender"]
 
 with col1:
     if gender_count.empty:
@@ -252,13 +278,7 @@ with col1:
 
         st.plotly_chart(fig_gender, use_container_width=True)
 
-# Hitung jumlah dan persentase
-jenjang_count = filtered_df['Jenjang pendidikan asal'].value_counts().reset_index()
-jenjang_count.columns = ['Jenjang Pendidikan', 'Jumlah']
-
-# Tambahkan kolom persentase manual
-total_pendaftar = jenjang_count['Jumlah'].sum()
-jenjang_count['Persentase'] = (jenjang_count['Jumlah'] / total_pendaftar * 100).round(1)
+jenjang_count = tables["jenjang"]
 with col2:
     if jenjang_count.empty:
         st.info("ℹ️ Tidak ada data jenjang pendidikan pada filter ini.")
@@ -291,17 +311,7 @@ st.divider()
 col1, col2 = st.columns(2)
 
 # --- BAGIAN INSTANSI ---
-instansi_count = (
-    filtered_df['Asal Instansi']
-    .value_counts()
-    .sort_values(ascending=True)
-    .reset_index()
-)
-instansi_count.columns = ['Asal Instansi', 'Jumlah']
-
-# Hitung Persentase Instansi
-total_instansi = instansi_count['Jumlah'].sum()
-instansi_count['Persentase'] = (instansi_count['Jumlah'] / total_instansi * 100).round(1)
+instansi_count = tables["instansi"]
 
 with col1:
     if instansi_count.empty:
@@ -328,17 +338,7 @@ with col1:
 
 
 # --- BAGIAN SEMESTER ---
-semester_count = (
-    filtered_df[semester_col]
-    .value_counts()
-    .sort_index()
-    .reset_index()
-)
-semester_count.columns = ['Semester', 'Jumlah']
-
-# Hitung Persentase Semester
-total_semester = semester_count['Jumlah'].sum()
-semester_count['Persentase'] = (semester_count['Jumlah'] / total_semester * 100).round(1)
+semester_count = tables["semester"]
 
 with col2:
     if semester_count.empty:
@@ -364,32 +364,37 @@ st.divider()
 # ==================================================
 # TREND
 # ==================================================
-trend = (
-    filtered_df
-    .groupby(filtered_df['Timestamp'].dt.date)
-    .size()
-    .reset_index(name='Jumlah')
+# Granularitas & jenis deret diganti tanpa menghitung ulang dari baris: semua dari array per jam
+g_col, s_col = st.columns([2, 1])
+granularity = g_col.radio(
+    "Granularitas",
+    list(GRANULARITIES),
+    index=1,
+    format_func=GRANULARITIES.get,
+    horizontal=True,
+    key="trend_granularity"
 )
+trend_series = s_col.selectbox("Deret", ["Jumlah", "Kumulatif", "Rata-rata Bergulir"], key="trend_series")
+x_label = {"jam": "Jam", "hari": "Tanggal", "minggu": "Minggu mulai"}[granularity]
+
+# Jumlah per bucket + kontribusi (%) tiap bucket terhadap total rentang
+trend = trend_table(hourly, date_start, date_end, granularity)
 
 if trend.empty:
     st.info("ℹ️ Tidak ada data tren pada rentang tanggal ini.")
 else:
-    # Hitung total untuk mendapatkan persentase harian
-    total_pendaftar_trend = trend['Jumlah'].sum()
-    trend['Persentase'] = (trend['Jumlah'] / total_pendaftar_trend * 100).round(1)
-
     fig_trend = px.line(
         trend,
         x='Timestamp',
-        y='Jumlah',
+        y=trend_series,
         custom_data=['Persentase'], # Masukkan data persentase
         title='Tren Waktu Pendaftaran'
     )
     
     fig_trend.update_traces(
         mode='lines+markers',
-        # Menampilkan tanggal, jumlah orang, dan persentase kontribusi hari tersebut
-        hovertemplate='Tanggal: %{x}<br>Jumlah: %{y} orang<br>Kontribusi: %{customdata[0]}%'
+        # Menampilkan waktu, nilai deret, dan persentase kontribusi bucket tersebut
+        hovertemplate=f'{x_label}: %{{x}}<br>{trend_series}: %{{y}} orang<br>Kontribusi: %{{customdata[0]}}%'
     )
     
     fig_trend.update_layout(
@@ -398,19 +403,29 @@ else:
     
     st.plotly_chart(fig_trend, use_container_width=True)
 
+    # Jam tersibuk dalam sehari, dari array per jam yang sama dengan grafik tren
+    fig_hours = px.bar(
+        hours,
+        x='Jam',
+        y='Jumlah',
+        custom_data=['Persentase'],
+        title='Distribusi Jam Pendaftaran',
+        color='Jumlah'
+    )
+    fig_hours.update_traces(
+        textposition='none',
+        hovertemplate='Jam: %{x}<br>Jumlah: %{y} orang<br>Persentase: %{customdata[0]}%'
+    )
+    fig_hours.update_layout(coloraxis_showscale=False)
+    st.plotly_chart(fig_hours, use_container_width=True)
+
 # ==================================================
 # INSIGHT
 # ==================================================
-semester_count = filtered_df[semester_col].value_counts()
-
-if not semester_count.empty:
-    semester_terbanyak = semester_count.idxmax()
-    jumlah_semester_terbanyak = semester_count.max()
-    persentase_semester = (jumlah_semester_terbanyak / total_pendaftar) * 100
-else:
-    semester_terbanyak = "-"
-    jumlah_semester_terbanyak = 0
-    persentase_semester = 0
+insight = semester_insight(cube, selections, between, total_pendaftar)
+semester_terbanyak = insight["semester_terbanyak"]
+jumlah_semester_terbanyak = insight["jumlah"]
+persentase_semester = insight["persentase"]
 
 st.subheader("📌 Insight Singkat")
 st.caption("Insight diperbarui otomatis berdasarkan filter aktif.")
@@ -420,7 +435,13 @@ st.write(
     - Total peserta yang dianalisis: **{total_pendaftar} orang**
     - Instansi terbanyak: **{instansi_terbanyak.title()}**
     - Hari pendaftaran terpadat: **{hari_terpadat}**
+    - Jam pendaftaran tersibuk: **{jam_tersibuk}**
     - Semester dominan: **{semester_terbanyak}**
       (**{jumlah_semester_terbanyak} peserta / {persentase_semester:.1f}%**)
     """
 )
+
+# ==================================================
+# DEBUG: WAKTU PER TAHAP
+# ==================================================
+debug_panel(recorder)
@@ -1,7 +1,16 @@
+from functools import partial
+
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 
+from gik.analytics.peserta import (
+    build_filter_index, build_sql_table, distribution_tables, filter_options, frame_counts, kpis
+)
+from gik.datasets import load_peserta
+from gik.instrument import Recorder, computes, stage
+from gik.sqlstore import USE_SQL
+from gik.ui import debug_panel
+
 # ==================================================
 # GLOBAL STYLE (ACCESSIBLE & EYE-CATCHING)
 # ==================================================
@@ -16,6 +25,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Pencatat waktu per tahap untuk rerun ini (lihat gik/instrument.py)
+recorder = Recorder("dashboard_peserta")
+
 # ==================================================
 # UI POLISH (CSS)
 # ==================================================
@@ -57,79 +69,33 @@ st.markdown(
 # ==================================================
 # LOAD DATA + CLEANING
 # ==================================================
-@st.cache_data
+@st.cache_resource
+@computes
 def load_data():
-    df = pd.read_csv("data/data_peserta.csv")
-    df.columns = df.columns.str.strip()
-
-    def clean_text(series):
-        return series.astype(str).str.strip()
-
-    if 'Asal Instansi' in df.columns:
-        df['Asal Instansi'] = clean_text(df['Asal Instansi']).str.lower()
-
-    if 'Jenis Kelamin' in df.columns:
-        df['Jenis Kelamin'] = clean_text(df['Jenis Kelamin']).str.title()
-
-    if 'Fakultas/Sekolah Asal' in df.columns:
-        df['Fakultas/Sekolah Asal'] = clean_text(df['Fakultas/Sekolah Asal']).str.title()
-
-    if 'Prodi Asal' in df.columns:
-        df['Prodi Asal'] = clean_text(df['Prodi Asal']).str.title()
-
-    if 'Semester' in df.columns:
-        df['Semester'] = clean_text(df['Semester'])
-
-    def normalize_instansi(name):
-        if not isinstance(name, str):
-            return name
-        n = name.lower()
-        if 'gadjah' in n or n.strip() == 'ugm':
-            return 'Universitas Gadjah Mada'
-        if 'upn' in n:
-            return 'UPN Veteran Yogyakarta'
-        if 'sunan' in n or 'uin' in n:
-            return 'Universitas Islam Negeri Sunan Kalijaga'
-        if 'amikom' in n:
-            return 'Universitas Amikom Yogyakarta'
-        if 'uty' in n or 'teknologi yogyakarta' in n:
-            return 'Universitas Teknologi Yogyakarta'
-        return name.title()
-
-    if 'Asal Instansi' in df.columns:
-        df['Asal Instansi'] = df['Asal Instansi'].apply(normalize_instansi)
-
-    def derive_jenjang(prodi, fakultas=None):
-        if not isinstance(prodi, str):
-            prodi = ''
-        p = prodi.lower()
-        if p.startswith('s1') or 'sarjana' in p:
-            return 'S1'
-        if p.startswith('s2') or 'magister' in p or 'master' in p:
-            return 'S2'
-        if p.startswith('d4') or 'vokasi' in (fakultas or '').lower():
-            return 'Vokasi'
-        return 'Lainnya'
-
-    if 'Prodi Asal' in df.columns:
-        df['Jenjang'] = df.apply(
-            lambda r: derive_jenjang(
-                r.get('Prodi Asal', ''),
-                r.get('Fakultas/Sekolah Asal', '')
-            ),
-            axis=1
-        )
-    else:
-        df['Jenjang'] = 'Lainnya'
-
-    if 'Semester' in df.columns:
-        df['Tahun Angkatan'] = df['Semester']
-    else:
-        df['Tahun Angkatan'] = 'N/A'
-
-    return df
-
-df = load_data()
+    # Satu DataFrame read-only (memory-mapped) dibagi semua sesi; jangan dimutasi.
+    # Cleaning, normalisasi instansi & turunan Jenjang ada di gik/datasets.py
+    return load_peserta()
+
+with stage("load", cached=True) as record:
+    df = load_data()
+    record["rows"] = len(df)
+
+@st.cache_resource
+@computes
+def get_filter_index():
+    # Bitmap per nilai unik untuk setiap kolom filter sidebar, dibangun sekali
+    return build_filter_index(load_data())
+
+@st.cache_resource
+@computes
+def get_sql_table():
+    # GIK_BACKEND=sqlite: tabel peserta di SQLite lokal, filter & agregasi sebagai query berparameter
+    return build_sql_table(load_data())
+
+def get_options(col):
+    if USE_SQL:
+        return get_sql_table().options(col)
+    return filter_options(df, col)
 
 # ==================================================
 # RESET FILTER
@@ -158,9 +124,9 @@ if st.sidebar.button("🔄 Reset Semua Filter"):
 st.sidebar.divider()
 st.sidebar.markdown("### 🔎 Filter Dimensi")
 
-instansi_options = ["Semua"] + sorted(df["Asal Instansi"].dropna().unique())
-jenjang_options = ["Semua"] + sorted(df["Jenjang"].dropna().unique())
-angkatan_options = ["Semua"] + sorted(df["Tahun Angkatan"].dropna().unique())
+instansi_options = ["Semua"] + get_options("Asal Instansi")
+jenjang_options = ["Semua"] + get_options("Jenjang")
+angkatan_options = ["Semua"] + get_options("Tahun Angkatan")
 
 instansi_selected = st.sidebar.selectbox("🏫 Asal Universitas", instansi_options, key="instansi_selected")
 jenjang_selected = st.sidebar.selectbox("🎓 Jenjang Pendidikan", jenjang_options, key="jenjang_selected")
@@ -169,16 +135,31 @@ angkatan_selected = st.sidebar.selectbox("📚 Tahun Angkatan", angkatan_options
 # ==================================================
 # APPLY FILTER
 # ==================================================
-filtered_df = df.copy()
+selections = {}
 
 if instansi_selected != "Semua":
-    filtered_df = filtered_df[filtered_df["Asal Instansi"] == instansi_selected]
+    selections["Asal Instansi"] = instansi_selected
 
 if jenjang_selected != "Semua":
-    filtered_df = filtered_df[filtered_df["Jenjang"] == jenjang_selected]
+    selections["Jenjang"] = jenjang_selected
 
 if angkatan_selected != "Semua":
-    filtered_df = filtered_df[filtered_df["Tahun Angkatan"] == angkatan_selected]
+    selections["Tahun Angkatan"] = angkatan_selected
+
+if USE_SQL:
+    # Filter jadi klausa WHERE berindeks; hanya tabel jumlah per nilai yang dikembalikan
+    with stage("filter", cached=True) as record:
+        sql_table = get_sql_table()
+        total_rows = sql_table.total(selections)
+        record["rows"] = total_rows
+    counts = partial(sql_table.counts, selections=selections)
+else:
+    # AND bitmap antar filter, hanya baris yang lolos yang diambil dari df
+    with stage("filter", cached=True) as record:
+        filtered_df = get_filter_index().select(df, selections)
+        record["rows"] = len(filtered_df)
+    total_rows = len(filtered_df)
+    counts = frame_counts(filtered_df)
 
 # ==================================================
 # HEADER
@@ -193,18 +174,13 @@ st.divider()
 # ==================================================
 # KPI SECTION
 # ==================================================
-total_peserta = filtered_df.shape[0]
-
-if total_peserta > 0:
-    instansi_counts = filtered_df["Asal Instansi"].value_counts()
-    jenjang_counts = filtered_df["Jenjang"].value_counts()
-    instansi_terbanyak = instansi_counts.idxmax()
-    jenjang_terbanyak = jenjang_counts.idxmax()
-    instansi_pct = (instansi_counts.max() / total_peserta) * 100
-else:
-    instansi_terbanyak = "-"
-    jenjang_terbanyak = "-"
-    instansi_pct = 0
+# KPI & tabel grafik dihitung di gik/analytics/peserta.py
+summary = kpis(total_rows, counts)
+total_peserta = summary["total_peserta"]
+instansi_terbanyak = summary["instansi_terbanyak"]
+jenjang_terbanyak = summary["jenjang_terbanyak"]
+instansi_pct = summary["instansi_pct"]
+tables = distribution_tables(counts)
 
 k1, k2, k3 = st.columns(3)
 k1.metric("👥 Total Peserta", total_peserta)
@@ -219,12 +195,7 @@ st.divider()
 col1, col2 = st.columns(2)
 
 # --- BAGIAN JENJANG ---
-jenjang_count = filtered_df["Jenjang"].value_counts().reset_index()
-jenjang_count.columns = ["Jenjang", "Jumlah"]
-
-# Hitung persentase untuk Jenjang
-total_j = jenjang_count["Jumlah"].sum()
-jenjang_count["Persentase"] = (jenjang_count["Jumlah"] / total_j * 100).round(1)
+jenjang_count = tables["jenjang"]
 
 with col1:
     if jenjang_count.empty:
@@ -253,12 +224,7 @@ with col1:
         st.plotly_chart(fig_jenjang, use_container_width=True)
 
 # --- BAGIAN ANGKATAN ---
-angkatan_count = filtered_df["Tahun Angkatan"].value_counts().reset_index()
-angkatan_count.columns = ["Tahun Angkatan", "Jumlah"]
-
-# Hitung persentase untuk Angkatan
-total_a = angkatan_count["Jumlah"].sum()
-angkatan_count["Persentase"] = (angkatan_count["Jumlah"] / total_a * 100).round(1)
+angkatan_count = tables["angkatan"]
 
 with col2:
     if angkatan_count.empty:
@@ -286,17 +252,7 @@ st.divider()
 # ==================================================
 # ROW 2 – ASAL INSTANSI
 # ==================================================
-instansi_count = (
-    filtered_df["Asal Instansi"]
-    .value_counts()
-    .sort_values(ascending=True)
-    .reset_index()
-)
-instansi_count.columns = ["Asal Instansi", "Jumlah"]
-
-# Hitung persentase untuk Instansi
-total_i = instansi_count["Jumlah"].sum()
-instansi_count["Persentase"] = (instansi_count["Jumlah"] / total_i * 100).round(1)
+instansi_count = tables["instansi"]
 
 if instansi_count.empty:
     st.info("📭 Tidak ada data asal universitas untuk filter yang dipilih.")
@@ -355,3 +311,8 @@ st.caption(
     "📌 GIKnowledge Building Participant Dashboard | "
     "Interactive Data Analyst Intern Assessment"
 )
+
+# ==================================================
+# DEBUG: WAKTU PER TAHAP
+# ==================================================
+debug_panel(recorder)
@@ -1,22 +1,20 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import re
-import nltk
-import plotly.express as px
-from wordcloud import WordCloud
-from collections import Counter
-from nltk.corpus import stopwords
-from nltk.util import ngrams
 
-# =====================
-# INITIALIZATION
-# =====================
-# Pastikan resource NLTK terunduh (opsional jika dijalankan di server baru)
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+from gik.analytics.evaluasi import (
+    REASONS_HIGH, REASONS_LOW, SEGMENTS, TEXT_QUESTIONS, aspiration_texts, build_keyword_index,
+    comment_groups, dominant_reason, indicator_distributions, keyword_hits, keyword_matcher, phrase_counter,
+    phrase_table, recommendation_summary, relevant_comments, segment_reason_scores, theme_evidence,
+    theme_model, theme_scores, top_theme, topic_summary, word_frequencies
+)
+from gik.datasets import load_evaluasi
+from gik.ingest import dataset_version
+from gik.instrument import Recorder, computes, stage
+from gik.keywords import REASON_MAP
+from gik.render import WordCloudRenderer
+from gik.scoring import SatisfactionScores
+from gik.text import Tokenizer
+from gik.ui import debug_panel
 
 # =====================
 # PAGE CONFIG
@@ -26,81 +24,110 @@ st.set_page_config(
     layout="wide"
 )
 
+# Pencatat waktu per tahap untuk rerun ini (lihat gik/instrument.py)
+recorder = Recorder("evaluasi")
+
 # =====================
 # HELPER FUNCTIONS
 # =====================
-def clean_text(text):
-    if pd.isna(text):
-        return []
-    
-    # Ambil stopwords bahasa Indonesia
-    stop_words = set(stopwords.words('indonesian'))
-    
-    # Custom Stopwords
-    custom_stop = {
-        "program", "giknowledge", "building", "kelas", "materi", "mentor", 
-        "peserta", "kegiatan", "gik", "nan", "pertanyaan", "relevan", "pilih", "jawaban"
-    }
-    stop_words.update(custom_stop)
-    
-    text = str(text).lower()
-    text = re.sub(r"[^a-z\s]", " ", text) # Hapus simbol & angka
-    
-    # Tokenisasi dan filter
-    tokens = [t for t in text.split() if t not in stop_words and len(t) > 3]
-    return tokens
-
-def extract_bigrams(text, n=5):
-    words = clean_text(text)
-    bigrams = list(ngrams(words, 2))
-    return Counter([" ".join(bg) for bg in bigrams]).most_common(n)
+# Perhitungan ada di gik/analytics/evaluasi.py; di sini hanya cache & tampilan
+@st.cache_resource
+def get_tokenizer():
+    # Stopword & regex disiapkan sekali per proses, token di-memo per teks respons
+    return Tokenizer()
+
+@st.cache_resource
+def get_wordcloud_renderer():
+    # Satu renderer per proses; cache PNG dibagi antar sesi dan dibatasi jumlah entrinya
+    return WordCloudRenderer(max_entries=16)
 
 def get_representative_comments(df, col_text, n=3):
     comments = df[col_text].dropna().astype(str)
     return comments.head(n).tolist()
 
-def get_relevant_comments(df, keywords, n=3):
-    filtered = df["saran"].dropna().astype(str)
-    filtered = filtered[
-        filtered.str.lower().apply(lambda x: any(k in x for k in keywords))
-    ]
-    return filtered.head(n).tolist()
-
-def get_dominant_reason(text, reason_map):
-    scores = {}
-    text_lower = text.lower()
-    for reason, keywords in reason_map.items():
-        scores[reason] = sum(text_lower.count(k) for k in keywords)
-    scores = {k: v for k, v in scores.items() if v > 0}
-    return max(scores, key=scores.get) if scores else None
+@st.cache_resource(max_entries=1)
+@computes
+def get_keyword_index(version):
+    # Dibangun sekali per versi dataset: token -> posisi baris untuk semua kolom teks bebas
+    return build_keyword_index(load_data(version))
+
+def get_relevant_comments(df, rows, keywords, n=3, col="saran"):
+    # rows = posisi baris segmen; hasil tetap mengikuti urutan data asli
+    with stage("bukti_komentar", cached=True):
+        groups = get_comment_groups(data_version).get(col)
+        return relevant_comments(get_keyword_index(data_version), df, rows, keywords, n=n, col=col, groups=groups)
+
+@st.cache_resource(max_entries=1)
+@computes
+def get_comment_groups(version):
+    # Jawaban identik digabung (berbobot) & jawaban mirip dikelompokkan (MinHash LSH), sekali per versi
+    return comment_groups(load_data(version))
+
+@st.cache_resource
+def get_keyword_matcher():
+    # Satu automaton untuk kamus alasan (Analisis Bauran)
+    return keyword_matcher()
+
+@st.cache_resource(max_entries=1)
+@computes
+def get_keyword_hits(version):
+    # Matriks responden x kata kunci alasan, dihitung sekali per versi dataset
+    return keyword_hits(load_data(version), get_keyword_matcher(), get_comment_groups(version))
+
+@st.cache_resource(max_entries=1)
+@computes
+def get_theme_model(version):
+    # DTM sparse + skor tema TF-IDF per responden, dibangun sekali per versi dataset
+    return theme_model(load_data(version), get_tokenizer())
+
+def get_segment_scores(rows):
+    return segment_reason_scores(get_keyword_matcher(), get_keyword_hits(data_version)["reason"], rows)
 
 # =====================
 # LOAD DATA
 # =====================
-@st.cache_data
-def load_data():
-    # Pastikan file CSV tersedia di path berikut
-    df = pd.read_csv("data/data_evaluasi.csv") 
-    df.columns = df.columns.str.strip()
-
-    column_mapping = {
-        '5.1. Seberapa puas Anda terhadap Anda menilai kemampuan mentor dalam menjelaskan materi?': 'puas_mentor',
-        '5.4. Seberapa puas Anda terhadap metode pembelajaran yang digunakan oleh mentor?': 'puas_metode',
-        '5.5. Seberapa puas Anda terhadap materi kelas Program GIKnowledge Building 2025?': 'puas_materi',
-        '5.7. Apakah materi dan kegiatan yang diberikan sesuai dengan kebutuhan pengembangan Anda?': 'sesuai_kebutuhan',
-        '5.8. Apakah Program GIKnowledge Building membantu Anda memahami hal-hal baru yang relevan dengan rencana pekerjaan atau karier Anda?': 'relevan_karier',
-        '5.9. Apakah Anda merasa lebih percaya diri setelah mengikuti program ini?': 'percaya_diri',
-        '5.10. Sejauh mana program ini memberi dampak positif bagi cara Anda bekerja, berpikir, atau berkolaborasi?': 'dampak_positif',
-        '5.11. Bagaimana pendapat Anda tentang jadwal dan durasi setiap sesi?': 'jadwal_durasi',
-        '5.12. Seberapa puas Anda terhadap fasilitas kelas GIKnowledge Building 2025?': 'puas_fasilitas',
-        '5.14. Seberapa puas Anda terhadap Tim GIK dalam memberikan bimbingan dan dukungan yang cukup selama  penyelenggaraan Program GIKnowledge Building 2025?': 'puas_tim',
-        '5.19. Berdasarkan level kepuasanmu terhadap keseluruhan pelaksanaan program sejauh ini, seberapa mungkin Anda memberi rekomendasi ke teman atau mahasiswa lain untuk mengikuti Program GIKnowledge Building?': 'rekomendasi',
-        '5.18. Apakah ada topik, metode, atau aktivitas baru yang ingin Anda tambahkan pada pelaksanaan selanjutnya?': 'harapan',
-        '5.22. Berikan saran perbaikan untuk pengembangan dan keberlanjutan Program GIKnowledge Building!': 'saran'
-    }
-    return df.rename(columns=column_mapping)
-
-df = load_data()
+@st.cache_resource(max_entries=1)
+@computes
+def load_data(version):
+    # Satu DataFrame read-only dari cache Arrow yang di-memory-map, dibagi semua sesi (jangan dimutasi).
+    # Lihat gik/datasets.py untuk pemetaan kolom.
+    # `version` (mtime + ukuran CSV) hanya dipakai sebagai kunci cache.
+    return load_evaluasi()
+
+@st.cache_data(max_entries=1)
+@computes
+def get_distributions(version):
+    # Distribusi semua indikator Likert dihitung sekali per versi dataset
+    return indicator_distributions(load_data(version))
+
+@st.cache_data(max_entries=1)
+@computes
+def get_word_frequencies(version):
+    # Frekuensi kata saran + harapan, dihitung sekali per versi dataset (lihat gik/parallel.py)
+    return word_frequencies(get_tokenizer(), aspiration_texts(load_data(version)))
+
+@st.cache_resource(max_entries=1)
+@computes
+def get_phrase_counter(version):
+    # Sketch top-k frasa per pertanyaan terbuka & segmen kepuasan, dibangun sekali per versi dataset
+    return phrase_counter(load_data(version), get_satisfaction_scores(version), get_tokenizer())
+
+@st.cache_data(max_entries=1)
+@computes
+def get_topic_summary(version):
+    # Model topik tersimpan di data/.cache; hanya jawaban baru yang diproses (partial_fit, lihat gik/topics.py)
+    return topic_summary(load_data(version), get_tokenizer(), source=version)
+
+@st.cache_resource(max_entries=1)
+@computes
+def get_satisfaction_scores(version):
+    # Matriks skor kepuasan disimpan terpisah dari DataFrame (df tidak dimutasi)
+    return SatisfactionScores(load_data(version))
+
+with stage("load", cached=True) as record:
+    data_version = dataset_version("data_evaluasi")
+    df = load_data(data_version)
+    record["rows"] = len(df)
 
 # =====================
 # SIDEBAR
@@ -137,20 +164,10 @@ if page == "🏠 Overview":
     # ===== METRIC SUMMARY =====
     col1, col2, col3 = st.columns(3)
 
-    # 1. Menghitung jumlah responden yang memberikan jawaban valid (bukan NaN)
-    df_valid = df.dropna(subset=["rekomendasi"])
-    total_responden_valid = len(df_valid)
-
-    # 2. Logic Akumulasi: (Sangat Direkomendasikan + Direkomendasikan) / Total Valid
-    if total_responden_valid > 0:
-        # Menghitung jumlah masing-masing kategori
-        sangat_direkom = (df_valid["rekomendasi"] == "Sangat direkomendasikan").sum()
-        direkomendasikan = (df_valid["rekomendasi"] == "Direkomendasikan").sum()
-        
-        # Menghitung persentase akumulatif agar sinkron dengan penjumlahan di grafik loyalitas
-        rekom_pct = round((sangat_direkom + direkomendasikan) / total_responden_valid * 100, 1)
-    else:
-        rekom_pct = 0.0
+    # Responden valid & akumulasi (Sangat Direkomendasikan + Direkomendasikan) / Total Valid
+    summary = recommendation_summary(df)
+    total_responden_valid = summary["total_responden"]
+    rekom_pct = summary["rekom_pct"]
 
     # --- TAMPILAN METRIC ---
     col1.metric(
@@ -190,6 +207,9 @@ if page == "🏠 Overview":
 # 📊 PAGE: ANALISIS KUANTITATIF
 # =====================
 elif page == "📊 Analisis Kuantitatif":
+    # Plotly hanya dimuat saat halaman ini dibuka (modul di-cache Python setelah import pertama)
+    import plotly.express as px
+
     st.title("📊 Analisis Kuantitatif Program GIKnowledge Building 2025")
     st.caption(
         "Analisis berbasis 11 indikator utama untuk mengukur kualitas pengajaran, "
@@ -223,16 +243,9 @@ elif page == "📊 Analisis Kuantitatif":
         }
     }
 
-    # =====================
-    # URUTAN JAWABAN
-    # =====================
-    sort_order = [
-        "Sangat puas", "Puas", "Netral", "Tidak puas", "Sangat tidak puas",
-        "Sangat berdampak", "Berdampak",
-        "Cukup/ideal", "Terlalu singkat", "Terlalu panjang",
-        "Sangat direkomendasikan", "Direkomendasikan", "Tidak direkomendasikan",
-        "Ya", "Tidak"
-    ]
+    # Tabel distribusi sudah dihitung sekali (urutan jawaban: gik/likert.py)
+    with stage("distribusi", cached=True):
+        distributions = get_distributions(data_version)
 
     # =====================
     # LOOP PER KLASIFIKASI
@@ -251,38 +264,16 @@ elif page == "📊 Analisis Kuantitatif":
                     st.error(f"Kolom `{col_name}` tidak ditemukan.")
                     continue
 
-                data = df[col_name].dropna()
-                if data.empty:
+                dist = distributions.get(col_name)
+                if dist is None:
                     st.warning("Tidak ada data responden.")
                     continue
 
-                freq = df[col_name].dropna().value_counts()
-
-                if freq.empty:
-                    st.warning("Tidak ada data.")
-                    continue
-
-                freq_df = freq.reset_index()
-                freq_df.columns = ["Jawaban", "Jumlah"]
-
-                freq_df["Persentase"] = round(
-                    freq_df["Jumlah"] / freq_df["Jumlah"].sum() * 100, 1
-                )
-
-
-                # Urutkan kategori
-                existing_order = [o for o in sort_order if o in freq_df["Jawaban"].values]
-                if existing_order:
-                    freq_df["Jawaban"] = pd.Categorical(
-                        freq_df["Jawaban"],
-                        categories=existing_order,
-                        ordered=True
-                    )
-                    freq_df = freq_df.sort_values("Jawaban")
+                freq_df = dist["table"]
 
                 # Mayoritas
-                dominant = freq.idxmax()
-                pct = round((freq.max() / freq.sum()) * 100, 1)
+                dominant = dist["dominant"]
+                pct = dist["dominant_pct"]
 
                 # =====================
                 # MINI KPI
@@ -292,7 +283,7 @@ elif page == "📊 Analisis Kuantitatif":
                     value=dominant
                 )
 
-                is_yes_no = set(freq_df["Jawaban"]).issubset({"Ya", "Tidak"})
+                is_yes_no = dist["is_yes_no"]
 
                 # =====================
                 # VISUALISASI
@@ -372,12 +363,9 @@ elif page == "📝 Analisis Kualitatif":
     # =====================
     # PREPARASI DATA TEKS
     # =====================
-    text_data = pd.concat([df["saran"], df["harapan"]]).dropna()
-    all_tokens = []
-    for t in text_data:
-        all_tokens.extend(clean_text(t))
-
-    freq = Counter(all_tokens)
+    with stage("frekuensi_kata", cached=True) as record:
+        freq = get_word_frequencies(data_version)
+        record["rows"] = len(aspiration_texts(df))
     most_common = freq.most_common(15)
 
     # =====================
@@ -402,21 +390,10 @@ elif page == "📝 Analisis Kualitatif":
 
         with col2:
             st.markdown("##### ☁️ Word Cloud Aspirasi")
-            if all_tokens:
-                # Menambahkan sedikit estetika pada wordcloud
-                wc = WordCloud(
-                    width=1000,
-                    height=600,
-                    background_color="white",
-                    colormap="viridis", # Mengganti ke viridis agar lebih modern
-                    max_words=100
-                ).generate(" ".join(all_tokens))
-
-                fig, ax = plt.subplots(figsize=(12, 7))
-                ax.imshow(wc, interpolation="bilinear")
-                ax.axis("off")
-                plt.tight_layout(pad=0)
-                st.pyplot(fig)
+            if freq:
+                # PNG di-cache berdasarkan hash tabel frekuensi (LRU, lihat gik/render.py)
+                png = get_wordcloud_renderer().render(freq)
+                st.image(png, use_container_width=True)
             else:
                 st.info("Word cloud tidak dapat ditampilkan.")
 
@@ -428,32 +405,10 @@ elif page == "📝 Analisis Kualitatif":
     st.subheader("📊 Pemetaan Tema Strategis")
     st.markdown("Aspirasi peserta dikelompokkan ke dalam kategori berikut berdasarkan kemunculan kata kunci:")
 
-    THEME_MAP = {
-        "Kemitraan & Karier": [
-            "mitra", "perusahaan", "industri", "magang",
-            "kerja", "lapangan", "kunjungan", "umkm"
-        ],
-        "Metode Pembelajaran": [
-            "praktik", "diskusi", "interaktif", "tugas",
-            "langsung", "praktek", "seru", "materi"
-        ],
-        "Manajemen & Fasilitas": [
-            "jadwal", "waktu", "durasi", "sesi",
-            "bentrok", "malam", "pagi", "link", "zoom", "fasilitas"
-        ]
-    }
-
-    # Hitung data tema
-    theme_results = []
-    for theme, keywords in THEME_MAP.items():
-        matched_words = [k for k in keywords if k in freq]
-        theme_results.append({
-            "Tema": theme,
-            "Kata": matched_words,
-            "Skor": sum(freq[k] for k in matched_words)
-        })
-
-    theme_df = pd.DataFrame(theme_results)
+    # Hitung data tema dari matriks dokumen-kata sparse (THEME_MAP ada di gik/keywords.py)
+    with stage("tema", cached=True):
+        model = get_theme_model(data_version)
+        theme_df = theme_scores(model)
     t_cols = st.columns(3)
 
     for i, row in theme_df.iterrows():
@@ -473,21 +428,78 @@ elif page == "📝 Analisis Kualitatif":
                 else:
                     st.caption("Tidak ada kata kunci terdeteksi.")
 
+                # Responden yang skor TF-IDF tertingginya jatuh pada tema ini
+                st.caption(f"👥 {row['Responden']} responden menjadikan tema ini fokus utama")
+                evidence = theme_evidence(model, df, row["Tema"])
+                if evidence:
+                    with st.expander("💬 Contoh aspirasi"):
+                        for comment in evidence:
+                            st.markdown(f"- _{comment}_")
+
     st.markdown("<br>", unsafe_allow_html=True)
 
     # =====================
     # INSIGHT UTAMA
     # =====================
-    if not theme_df.empty:
-        # Mengurutkan berdasarkan skor tertinggi untuk insight dinamis
-        top_theme = theme_df.sort_values(by="Skor", ascending=False).iloc[0]
-        
+    # Tema dengan skor tertinggi untuk insight dinamis
+    main_theme = top_theme(theme_df)
+    if main_theme is not None:
         st.success(
             f"🎯 **Insight Utama:** Berdasarkan volume kata kunci, aspirasi peserta paling dominan berfokus pada tema "
-            f"**{top_theme['Tema'].upper()}**. Hal ini menunjukkan area tersebut merupakan prioritas utama "
+            f"**{main_theme['Tema'].upper()}**. Hal ini menunjukkan area tersebut merupakan prioritas utama "
             f"bagi peserta untuk pengembangan program di masa depan."
         )
 
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # =====================
+    # SECTION: FRASA PER PERTANYAAN
+    # =====================
+    with st.container(border=True):
+        st.subheader("🧩 Frasa Teratas per Pertanyaan Terbuka")
+        q_col, s_col, n_col = st.columns([2.2, 1.2, 1])
+        question = q_col.selectbox(
+            "Pertanyaan",
+            list(TEXT_QUESTIONS),
+            index=len(TEXT_QUESTIONS) - 1,
+            format_func=lambda c: TEXT_QUESTIONS[c].split("?")[0].split("!")[0]
+        )
+        segment = s_col.selectbox("Segmen Responden", list(SEGMENTS), format_func=SEGMENTS.get)
+        n_words = n_col.radio("Panjang Frasa", [1, 2, 3], index=1, format_func=lambda n: f"{n} kata", horizontal=True)
+
+        with stage("frasa", cached=True):
+            phrase_df = phrase_table(get_phrase_counter(data_version), question, segment, n_words, k=10)
+        if phrase_df.empty:
+            st.info("Belum ada frasa untuk pertanyaan & segmen ini.")
+        else:
+            st.dataframe(phrase_df, use_container_width=True, hide_index=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # =====================
+    # SECTION: TOPIK OTOMATIS
+    # =====================
+    st.subheader("🧭 Topik Otomatis dari Jawaban Terbuka")
+    with stage("topik", cached=True):
+        topics = get_topic_summary(data_version)
+    st.caption(
+        f"Klaster MiniBatchKMeans atas {topics['dokumen']} jawaban terbuka "
+        f"(diperbarui {topics['updated'].replace('T', ' ')}). Label = tiga kata terkuat di tiap klaster."
+    )
+    if not topics["topik"]:
+        st.info("Jawaban terbuka belum cukup untuk membentuk topik.")
+    else:
+        topic_cols = st.columns(2)
+        for i, topic in enumerate(topics["topik"]):
+            with topic_cols[i % 2]:
+                with st.container(border=True):
+                    st.markdown(f"**{topic['label']}**")
+                    st.caption(f"📝 {topic['jumlah']} jawaban • " + ", ".join(topic["kata"]))
+                    if topic["komentar"]:
+                        with st.expander("💬 Contoh jawaban"):
+                            for comment in topic["komentar"]:
+                                st.markdown(f"- _{comment}_")
+
     st.divider()
 
 # =====================
@@ -505,25 +517,20 @@ elif page == "🔄 Analisis Bauran":
         unsafe_allow_html=True
     )
 
-    # --- LOGIKA PERHITUNGAN (Tetap Sama) ---
-    score_map = {"Sangat puas": 5, "Puas": 4, "Netral": 3, "Tidak puas": 2, "Sangat tidak puas": 1}
-    score_cols = ["puas_mentor", "puas_metode", "puas_materi", "puas_fasilitas", "puas_tim"]
-
-    for col in score_cols:
-        df[col + "_score"] = df[col].map(score_map)
-    
-    df["avg_kepuasan"] = df[[c + "_score" for c in score_cols]].mean(axis=1, skipna=True)
-
-    high_sat = df[df["avg_kepuasan"] >= 4.2]
-    low_sat  = df[df["avg_kepuasan"] < 4.2]
-
-    REASON_MAP = {
-        "Akses perusahaan mitra & peluang magang": ["perusahaan", "mitra", "magang"],
-        "Pengalaman kunjungan industri yang aplikatif": ["kunjungan", "industri", "lapangan"],
-        "Pembelajaran praktis & relevan": ["praktik", "langsung", "digital"],
-        "Kendala jadwal dan durasi kegiatan": ["jadwal", "waktu", "durasi"],
-        "Keterbatasan pendampingan lanjutan": ["mentor", "evaluasi", "pendamping"]
-    }
+    # --- LOGIKA PERHITUNGAN (skor & segmen dari gik/scoring.py) ---
+    with stage("skor_kepuasan", cached=True):
+        scoring = get_satisfaction_scores(data_version)
+    high_rows = scoring.high_rows
+    low_rows = scoring.low_rows
+    high_avg = scoring.segment_mean(high_rows)
+    low_avg = scoring.segment_mean(low_rows)
+
+    # Skor alasan per segmen dari matriks kata kunci (REASON_MAP ada di gik/keywords.py)
+    reasons_high = REASONS_HIGH
+    reasons_low = REASONS_LOW
+    with stage("skor_alasan", cached=True):
+        scores_high = get_segment_scores(high_rows)
+        scores_low = get_segment_scores(low_rows)
 
     # --- LAYOUTING CARDS ---
     col1, col2 = st.columns(2)
@@ -533,23 +540,17 @@ elif page == "🔄 Analisis Bauran":
             st.markdown("<h3 style='color: #28a745;'>😊 Kepuasan Tinggi</h3>", unsafe_allow_html=True)
             st.metric(
                 "Rata-rata Skor Kepuasan",
-                round(high_sat["avg_kepuasan"].mean(), 2) if not high_sat.empty else 0
+                round(high_avg, 2) if len(high_rows) else 0
             )
 
             st.markdown("---")
             st.markdown("**Alasan Program Disukai Peserta:**")
 
-            text_high = " ".join(
-                high_sat[["saran", "harapan"]]
-                .fillna("")
-                .astype(str)
-                .agg(" ".join, axis=1)
-            ).lower()
-
             found_reason = False
 
-            for reason, keywords in list(REASON_MAP.items())[:3]:
-                if any(k in text_high for k in keywords):
+            for reason in reasons_high:
+                keywords = REASON_MAP[reason]
+                if scores_high[reason] > 0:
                     found_reason = True
 
                     # Narasi alasan
@@ -560,7 +561,7 @@ elif page == "🔄 Analisis Bauran":
 
                     # Bukti komentar
                     with st.expander("📌 Bukti Komentar Peserta"):
-                        comments = get_relevant_comments(high_sat, keywords)
+                        comments = get_relevant_comments(df, high_rows, keywords)
                         if comments:
                             for c in comments[:5]:
                                 st.markdown(f"- *{c}*")
@@ -579,23 +580,17 @@ elif page == "🔄 Analisis Bauran":
             st.markdown("<h3 style='color: #dc3545;'>😐 Kepuasan Lebih Rendah</h3>", unsafe_allow_html=True)
             st.metric(
                 "Rata-rata Skor Kepuasan",
-                round(low_sat["avg_kepuasan"].mean(), 2) if not low_sat.empty else 0
+                round(low_avg, 2) if len(low_rows) else 0
             )
 
             st.markdown("---")
             st.markdown("**Kendala Utama yang Dirasakan Peserta:**")
 
-            text_low = " ".join(
-                low_sat[["saran", "harapan"]]
-                .fillna("")
-                .astype(str)
-                .agg(" ".join, axis=1)
-            ).lower()
-
             found_issue = False
 
-            for reason, keywords in list(REASON_MAP.items())[3:]:
-                if any(k in text_low for k in keywords):
+            for reason in reasons_low:
+                keywords = REASON_MAP[reason]
+                if scores_low[reason] > 0:
                     found_issue = True
 
                     # Narasi kendala
@@ -606,7 +601,7 @@ elif page == "🔄 Analisis Bauran":
 
                     # Bukti komentar
                     with st.expander("📌 Bukti Komentar Peserta"):
-                        comments = get_relevant_comments(low_sat, keywords)
+                        comments = get_relevant_comments(df, low_rows, keywords)
                         if comments:
                             for c in comments[:5]:
                                 st.markdown(f"- *{c}*")
@@ -625,19 +620,24 @@ elif page == "🔄 Analisis Bauran":
     with st.container(border=True):
         st.subheader("📌 Kesimpulan Strategis Bauran")
         
-        dominant_high = get_dominant_reason(text_high, dict(list(REASON_MAP.items())[:3]))
-        dominant_low = get_dominant_reason(text_low, dict(list(REASON_MAP.items())[3:]))
+        dominant_high = dominant_reason(scores_high, reasons_high)
+        dominant_low = dominant_reason(scores_low, reasons_low)
 
         if dominant_high and dominant_low:
             # Gunakan st.info untuk highlight teks kesimpulan
             st.info(f"""
             Hasil analisis menunjukkan pola yang jelas:
-            1. **Faktor Pendorong (Promoter):** Peserta dengan tingkat kepuasan tinggi (Skor: {round(high_sat['avg_kepuasan'].mean(),2)}) 
+            1. **Faktor Pendorong (Promoter):** Peserta dengan tingkat kepuasan tinggi (Skor: {round(high_avg,2)}) 
                sangat dipengaruhi oleh **{dominant_high.lower()}**.
-            2. **Faktor Penghambat (Detractor):** Peserta dengan kepuasan lebih rendah (Skor: {round(low_sat['avg_kepuasan'].mean(),2)}) 
+            2. **Faktor Penghambat (Detractor):** Peserta dengan kepuasan lebih rendah (Skor: {round(low_avg,2)}) 
                merasa terganggu oleh **{dominant_low.lower()}**.
             """)
         else:
             st.write("Data bauran menunjukkan pola persepsi yang berbeda antara aspek manfaat program dan kendala teknis implementasi.")
 
-    st.divider()
\ No newline at end of file
+    st.divider()
+
+# =====================
+# DEBUG: WAKTU PER TAHAP
+# =====================
+debug_panel(recorder)
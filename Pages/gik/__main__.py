@@ -0,0 +1,4 @@
+from gik.cli import main
+
+if __name__ == "__main__":
+    main()
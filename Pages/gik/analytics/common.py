@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+
+def share_table(counts, label):
+    # Series jumlah -> tabel [label, Jumlah, Persentase] (persentase terhadap total tabel)
+    table = counts.reset_index()
+    table.columns = [label, "Jumlah"]
+    table["Persentase"] = (table["Jumlah"] / table["Jumlah"].sum() * 100).round(1)
+    return table
+
+
+def to_jsonable(value):
+    # Ubah hasil analitik (DataFrame/Series/numpy/tanggal) menjadi tipe yang bisa di-json.dump
+    if isinstance(value, pd.DataFrame):
+        return [to_jsonable(r) for r in value.to_dict("records")]
+    if isinstance(value, pd.Series):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is pd.NA or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
@@ -0,0 +1,277 @@
+import numpy as np
+import pandas as pd
+
+from gik.datasets import EVALUASI_COLUMNS, EVALUASI_LIKERT_COLUMNS, EVALUASI_TEXT_COLUMNS
+from gik.dedup import CommentGroups
+from gik.index import InvertedIndex
+from gik.keywords import REASON_MAP
+from gik.likert import compute_distributions
+from gik.matcher import KeywordMatcher
+from gik.ngrams import PhraseCounter
+from gik.parallel import ngram_counts
+from gik.scoring import SatisfactionScores
+
+# Tiga alasan pertama = pendorong kepuasan, sisanya = kendala (lihat gik/keywords.py)
+REASONS_HIGH = list(REASON_MAP)[:3]
+REASONS_LOW = list(REASON_MAP)[3:]
+
+# Pertanyaan terbuka sesuai urutan kuesioner (5.16 ... 5.22): nama kolom -> teks pertanyaan
+TEXT_QUESTIONS = {short: header for header, short in EVALUASI_COLUMNS.items() if short in EVALUASI_TEXT_COLUMNS}
+SEGMENTS = {"semua": "Semua responden", "tinggi": "Kepuasan tinggi", "rendah": "Kepuasan rendah"}
+
+
+# =====================
+# OVERVIEW
+# =====================
+def recommendation_summary(df):
+    """Jumlah responden valid & persentase (Sangat) Direkomendasikan."""
+    valid = df["rekomendasi"].dropna()
+    total = len(valid)
+    if total > 0:
+        # Akumulasi agar sinkron dengan penjumlahan di grafik loyalitas
+        promoters = (valid == "Sangat direkomendasikan").sum() + (valid == "Direkomendasikan").sum()
+        rekom_pct = round(promoters / total * 100, 1)
+    else:
+        rekom_pct = 0.0
+    return {"total_responden": total, "rekom_pct": rekom_pct}
+
+
+# =====================
+# KUANTITATIF
+# =====================
+def indicator_distributions(df):
+    return compute_distributions(df, EVALUASI_LIKERT_COLUMNS)
+
+
+# =====================
+# KUALITATIF
+# =====================
+def aspiration_texts(df):
+    # Saran + harapan (jawaban kosong dibuang)
+    return pd.concat([df["saran"], df["harapan"]]).dropna()
+
+
+def text_ngrams(tokenizer, texts):
+    # (unigram, bigram) Counter; dibagi ke process pool bila teks unik sangat banyak
+    return ngram_counts(texts, tokenizer)
+
+
+def word_frequencies(tokenizer, texts):
+    return text_ngrams(tokenizer, texts)[0]
+
+
+def keyword_matcher():
+    # Automaton untuk kamus alasan (halaman Analisis Bauran)
+    return KeywordMatcher(REASON_MAP)
+
+
+def comment_groups(df, columns=("saran", "harapan")):
+    # Grup jawaban identik (berbobot) & klaster jawaban mirip per kolom, lihat gik/dedup.py
+    return {col: CommentGroups(df[col]) for col in columns}
+
+
+def keyword_hits(df, matcher, groups=None):
+    """Matriks responden x kata kunci alasan.
+
+    "reason": saran+harapan ter-normalisasi, dicocokkan sebagai substring.
+    Normalisasi hanya menurunkan huruf & mengganti non-huruf dengan spasi, jadi
+    kata kunci (huruf saja) cocok persis seperti pada teks mentah, sementara
+    variasi jawaban ("Belum ada." / "belum ada") cukup dipindai sekali.
+    """
+    groups = groups or comment_groups(df)
+    text = groups["saran"].row_texts() + " " + groups["harapan"].row_texts()
+    return {"reason": matcher.count_matrix(text)}
+
+
+def theme_model(df, tokenizer):
+    # DTM sparse dari token bersih saran + harapan per responden (lihat gik/themes.py)
+    # Import di sini agar scipy hanya dimuat saat halaman Kualitatif/ekspor membutuhkannya
+    from gik.themes import ThemeModel
+
+    clean = tokenizer.tokenize_series(df["saran"]) + tokenizer.tokenize_series(df["harapan"])
+    return ThemeModel(clean.tolist())
+
+
+def theme_scores(model):
+    """Tabel Tema/Kata/Skor/Responden.
+
+    Kata & Skor = kata kunci yang muncul dan total kemunculannya; Responden =
+    jumlah responden yang tema utamanya (skor TF-IDF tertinggi) adalah tema tsb.
+    """
+    keyword_totals = model.keyword_totals()
+    volumes = model.volumes()
+    rows = []
+    for theme, keywords in model.theme_map.items():
+        matched = [k for k in keywords if keyword_totals[k] > 0]
+        rows.append({
+            "Tema": theme,
+            "Kata": matched,
+            "Skor": sum(keyword_totals[k] for k in matched),
+            "Responden": volumes[theme],
+        })
+    return pd.DataFrame(rows)
+
+
+def top_theme(themes):
+    if themes.empty:
+        return None
+    return themes.sort_values(by="Skor", ascending=False).iloc[0]
+
+
+def theme_evidence(model, df, theme, n=3):
+    # Saran/harapan responden dengan skor tertinggi untuk tema ini
+    rows = model.top_rows(theme, n)
+    texts = df[["saran", "harapan"]].iloc[rows]
+    return [" • ".join(str(t) for t in pair if pd.notna(t)) for pair in texts.itertuples(index=False)]
+
+
+def iter_responses(df, scoring, columns=TEXT_QUESTIONS):
+    """Generator ([kunci], teks, bobot) untuk semua jawaban terbuka.
+
+    Kunci = (kolom, segmen) untuk segmen "semua" dan segmen kepuasan. Jawaban
+    identik setelah normalisasi (CommentGroups, token sama) digabung dengan
+    bobot = jumlah responden di segmen tsb, berurutan menurut kemunculan
+    pertama di segmen, sehingga hitungan & urutan seri sama dengan per baris.
+    """
+    segments = {"semua": slice(None), "tinggi": scoring.high_rows, "rendah": scoring.low_rows}
+    for col in columns:
+        groups = CommentGroups(df[col])
+        for name, rows in segments.items():
+            codes = groups.group[rows]
+            codes = codes[codes >= 0]
+            uniques, first, weights = np.unique(codes, return_index=True, return_counts=True)
+            order = np.argsort(first, kind="stable")
+            for g, weight in zip(uniques[order].tolist(), weights[order].tolist()):
+                yield [(col, name)], groups.texts[g], weight
+
+
+def phrase_counter(df, scoring, tokenizer):
+    # Top-k frasa 1-3 kata per pertanyaan & segmen (Space-Saving, lihat gik/ngrams.py)
+    return PhraseCounter(tokenizer).consume(iter_responses(df, scoring))
+
+
+def phrase_table(counter, col, segment="semua", n=2, k=10):
+    return pd.DataFrame(counter.top((col, segment), n, k), columns=["Frasa", "Jumlah"])
+
+
+def topic_documents(df, columns=TEXT_QUESTIONS):
+    # (kunci stabil, teks) semua jawaban terbuka yang terisi, per kolom lalu per baris
+    from gik.topics import document_keys
+
+    keys = document_keys(df, columns)
+    texts = df[list(columns)].to_numpy().T
+    answered = pd.notna(texts)
+    return keys[answered], texts[answered].tolist()
+
+
+def topic_summary(df, tokenizer, source=None):
+    """Topik otomatis (MiniBatchKMeans, lihat gik/topics.py) yang tersimpan di cache.
+
+    Hanya jawaban yang belum pernah diproses yang dipakai untuk memperbarui model;
+    jika ringkasan sudah dibuat dari `source` yang sama, ringkasan dibaca langsung.
+    """
+    from gik.topics import cached_summary, update_topics
+
+    return cached_summary(source) or update_topics(*topic_documents(df), tokenizer, source)
+
+
+# =====================
+# BAURAN
+# =====================
+def build_keyword_index(df):
+    # token -> posisi baris untuk semua kolom teks bebas
+    return InvertedIndex.build(df, EVALUASI_TEXT_COLUMNS)
+
+
+def segment_reason_scores(matcher, reason_hits, rows):
+    # Skor alasan untuk satu segmen responden, dibaca dari matriks (tanpa scan teks ulang)
+    totals = matcher.group_matrix(reason_hits[rows].sum(axis=0))
+    return dict(zip(matcher.groups, totals.tolist()))
+
+
+def dominant_reason(scores, reasons):
+    scores = {r: scores[r] for r in reasons if scores[r] > 0}
+    return max(scores, key=scores.get) if scores else None
+
+
+def relevant_comments(index, df, rows, keywords, n=3, col="saran", groups=None):
+    """Komentar berisi kata kunci di antara `rows` (posisi baris segmen), urut data asli.
+
+    Dengan `groups` (CommentGroups kolom ini), komentar yang mirip hanya
+    ditampilkan sekali beserta jumlah komentar serupa di segmen tersebut.
+    """
+    hits = index.lookup(col, keywords, rows=rows)
+    if groups is None:
+        return df[col].iloc[hits[:n]].astype(str).tolist()
+    _, first, sizes = np.unique(groups.row_clusters()[hits], return_index=True, return_counts=True)
+    order = np.argsort(first)[:n]
+    texts = df[col].iloc[hits[first[order]]].astype(str).tolist()
+    return [t if size == 1 else f"{t} (+{size - 1} serupa)" for t, size in zip(texts, sizes[order].tolist())]
+
+
+# =====================
+# RINGKASAN LENGKAP (BATCH)
+# =====================
+def summarize(df, tokenizer, top_n=15, source=None):
+    """Semua agregat halaman evaluasi dalam satu dict (untuk ekspor CLI).
+
+    `source` = versi dataset (`dataset_version`) untuk ringkasan topik tersimpan.
+    """
+    matcher = keyword_matcher()
+    groups = comment_groups(df)
+    hits = keyword_hits(df, matcher, groups)
+    scoring = SatisfactionScores(df)
+    index = build_keyword_index(df)
+    freq, phrases = text_ngrams(tokenizer, aspiration_texts(df))
+
+    distributions = {
+        col: None if d is None else {
+            "table": d["table"],
+            "dominant": d["dominant"],
+            "dominant_pct": d["dominant_pct"],
+        }
+        for col, d in indicator_distributions(df).items()
+    }
+
+    bauran = {}
+    for name, rows, reasons in (
+        ("kepuasan_tinggi", scoring.high_rows, REASONS_HIGH),
+        ("kepuasan_rendah", scoring.low_rows, REASONS_LOW),
+    ):
+        scores = segment_reason_scores(matcher, hits["reason"], rows)
+        bauran[name] = {
+            "responden": len(rows),
+            "rata_rata": round(scoring.segment_mean(rows), 2) if len(rows) else None,
+            "skor_alasan": {r: scores[r] for r in reasons},
+            "alasan_dominan": dominant_reason(scores, reasons),
+            "bukti": {
+                r: relevant_comments(index, df, rows, REASON_MAP[r], groups=groups["saran"])
+                for r in reasons if scores[r] > 0
+            },
+        }
+
+    phrases_by_question = phrase_counter(df, scoring, tokenizer)
+    frasa = {}
+    for col in TEXT_QUESTIONS:
+        tables = [
+            phrase_table(phrases_by_question, col, segment, n, top_n).assign(Segmen=segment, N=n)
+            for segment in SEGMENTS for n in phrases_by_question.sizes
+        ]
+        frasa[col] = pd.concat(tables, ignore_index=True)[["Segmen", "N", "Frasa", "Jumlah"]]
+
+    model = theme_model(df, tokenizer)
+    themes = theme_scores(model)
+    top = top_theme(themes)
+    return {
+        "overview": recommendation_summary(df),
+        "distribusi": distributions,
+        "kata_teratas": pd.DataFrame(freq.most_common(top_n), columns=["Kata", "Jumlah"]),
+        "frasa_teratas": pd.DataFrame(phrases.most_common(top_n), columns=["Frasa", "Jumlah"]),
+        "frasa_per_pertanyaan": frasa,
+        "tema": themes,
+        "tema_utama": None if top is None else top["Tema"],
+        "bukti_tema": {theme: theme_evidence(model, df, theme) for theme in model.themes},
+        "topik": topic_summary(df, tokenizer, source)["topik"],
+        "bauran": bauran,
+    }
+
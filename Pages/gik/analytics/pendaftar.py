@@ -0,0 +1,160 @@
+import pandas as pd
+
+from gik.analytics.common import share_table
+from gik.cube import CountCube
+from gik.datasets import SEMESTER_COL
+from gik.sqlstore import SqlTable
+from gik.timeline import HourlyCounts, Timeline, from_day, from_hour, to_day
+
+# Dimensi kubus selain jam (urutan = urutan filter di sidebar)
+DIMENSIONS = ['Asal Instansi', 'Jenjang pendidikan asal', 'Jenis kelamin', SEMESTER_COL]
+
+# Granularitas grafik tren & lebar rata-rata bergulir (jumlah bucket)
+GRANULARITIES = {"jam": "Per Jam", "hari": "Per Hari", "minggu": "Per Minggu"}
+ROLLING_WINDOW = {"jam": 24, "hari": 7, "minggu": 4}
+
+
+# =====================
+# STRUKTUR DATA
+# =====================
+def build_timeline(df):
+    # Timestamp terurut (int64 ns) + jumlah per jam
+    return Timeline(df['Timestamp'])
+
+
+def build_cube(df, timeline):
+    # Jumlah pendaftar per (jam, instansi, jenjang, gender, semester)
+    return CountCube({'Jam': timeline.hours, **{dim: df[dim] for dim in DIMENSIONS}})
+
+
+def build_sql_table(df):
+    # Tabel SQLite berindeks (GIK_BACKEND=sqlite): API select/counts sama dengan kubus,
+    # `timeline()` menggantikan Timeline
+    return SqlTable.open("data_pendaftar", df, DIMENSIONS, time_column='Timestamp')
+
+
+def filter_options(df, col):
+    return sorted(df[col].unique())
+
+
+# =====================
+# FILTER & AGREGAT
+# =====================
+def date_bounds(date_start, date_end):
+    # Rentang tanggal inklusif -> nomor jam (awal hari pertama s.d. akhir hari terakhir) untuk `between`
+    return to_day(date_start) * 24, to_day(date_end) * 24 + 23
+
+
+def hourly_counts(cube, timeline, selections):
+    # Jumlah per jam untuk filter kategori; tanpa filter langsung pakai array timeline
+    if not selections:
+        return timeline
+    cells = cube.select(selections)
+    return HourlyCounts.from_hours(
+        cells['Jam'],
+        weights=cells['count'],
+        first_hour=timeline.first_hour,
+        n_hours=len(timeline.counts)
+    )
+
+
+def kpis(cube, daily, selections, date_start, date_end):
+    between = date_bounds(date_start, date_end)
+    total = daily.total(date_start, date_end)
+    if total > 0:
+        instansi_terbanyak = cube.counts('Asal Instansi', selections, between).idxmax()
+        hari_terpadat = daily.busiest_day(date_start, date_end)
+    else:
+        instansi_terbanyak = "-"
+        hari_terpadat = "-"
+    return {
+        "total_pendaftar": total,
+        "instansi_terbanyak": instansi_terbanyak,
+        "hari_terpadat": hari_terpadat,
+    }
+
+
+def distribution_tables(cube, selections, between):
+    # Tabel per grafik, urutan baris sama dengan yang ditampilkan
+    return {
+        "gender": share_table(cube.counts('Jenis kelamin', selections, between), 'Jenis Kelamin'),
+        "jenjang": share_table(cube.counts('Jenjang pendidikan asal', selections, between), 'Jenjang Pendidikan'),
+        "instansi": share_table(
+            cube.counts('Asal Instansi', selections, between).sort_values(ascending=True), 'Asal Instansi'
+        ),
+        "semester": share_table(cube.counts(SEMESTER_COL, selections, between).sort_index(), 'Semester'),
+    }
+
+
+def trend_table(hourly, date_start, date_end, granularity="hari"):
+    """Deret per jam/hari/minggu (hanya bucket berisi) + kontribusi (%) terhadap total rentang.
+
+    Kumulatif & rata-rata bergulir dihitung di atas deret padat (bucket kosong
+    ikut dihitung sebagai nol), jadi nilainya tetap benar di sela hari sepi.
+    """
+    starts, counts = hourly.buckets(granularity, date_start, date_end)
+    labels = [from_hour(h) if granularity == "jam" else from_day(h // 24) for h in starts.tolist()]
+    window = ROLLING_WINDOW[granularity]
+    trend = pd.DataFrame({
+        'Timestamp': pd.Series(labels, dtype=object),
+        'Jumlah': counts,
+        'Kumulatif': counts.cumsum(),
+        'Rata-rata Bergulir': pd.Series(counts).rolling(window, min_periods=1).mean().round(2),
+    })
+    trend = trend[trend['Jumlah'] > 0].reset_index(drop=True)
+    if not trend.empty:
+        trend.insert(2, 'Persentase', (trend['Jumlah'] / trend['Jumlah'].sum() * 100).round(1))
+    return trend
+
+
+def hour_table(hourly, date_start, date_end):
+    # Jumlah pendaftar per jam dalam sehari (00-23) untuk analisis jam tersibuk
+    counts = hourly.hour_of_day(date_start, date_end)
+    table = pd.DataFrame({'Jam': [f"{h:02d}:00" for h in range(24)], 'Jumlah': counts})
+    total = counts.sum()
+    table['Persentase'] = (table['Jumlah'] / total * 100).round(1) if total else 0.0
+    return table
+
+
+def peak_hour(hours):
+    # Jam tersibuk dari hour_table; jika seri, ambil jam paling awal
+    if hours['Jumlah'].sum() == 0:
+        return {"jam_tersibuk": "-", "jumlah": 0, "persentase": 0}
+    top = hours.iloc[int(hours['Jumlah'].to_numpy().argmax())]
+    return {"jam_tersibuk": top['Jam'], "jumlah": int(top['Jumlah']), "persentase": float(top['Persentase'])}
+
+
+def semester_insight(cube, selections, between, total):
+    counts = cube.counts(SEMESTER_COL, selections, between)
+    if counts.empty:
+        return {"semester_terbanyak": "-", "jumlah": 0, "persentase": 0}
+    return {
+        "semester_terbanyak": counts.idxmax(),
+        "jumlah": counts.max(),
+        "persentase": (counts.max() / total) * 100,
+    }
+
+
+# =====================
+# RINGKASAN LENGKAP (BATCH)
+# =====================
+def summarize(df, selections=None, date_start=None, date_end=None):
+    """Semua agregat halaman pendaftar untuk satu kombinasi filter (default: tanpa filter)."""
+    selections = selections or {}
+    timeline = build_timeline(df)
+    cube = build_cube(df, timeline)
+    date_start = date_start or timeline.min_date
+    date_end = date_end or timeline.max_date
+    between = date_bounds(date_start, date_end)
+
+    hourly = hourly_counts(cube, timeline, selections)
+    summary = kpis(cube, hourly.daily(), selections, date_start, date_end)
+    hours = hour_table(hourly, date_start, date_end)
+    return {
+        "filter": {**selections, "tanggal_awal": date_start, "tanggal_akhir": date_end},
+        "kpi": summary,
+        "distribusi": distribution_tables(cube, selections, between),
+        "tren": {g: trend_table(hourly, date_start, date_end, g) for g in GRANULARITIES},
+        "jam": {**peak_hour(hours), "tabel": hours},
+        "semester": semester_insight(cube, selections, between, summary["total_pendaftar"]),
+    }
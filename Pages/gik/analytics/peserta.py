@@ -0,0 +1,61 @@
+from gik.analytics.common import share_table
+from gik.filters import BitmapIndex
+from gik.schema import value_counts
+from gik.sqlstore import SqlTable
+
+# Kolom filter sidebar
+FILTER_COLUMNS = ["Asal Instansi", "Jenjang", "Tahun Angkatan"]
+
+
+def build_filter_index(df):
+    # Bitmap per nilai unik untuk setiap kolom filter sidebar
+    return BitmapIndex({col: df[col] for col in FILTER_COLUMNS})
+
+
+def build_sql_table(df):
+    # Tabel SQLite berindeks per kolom filter (GIK_BACKEND=sqlite), pengganti bitmap + DataFrame
+    return SqlTable.open("data_peserta", df, FILTER_COLUMNS)
+
+
+def filter_options(df, col):
+    return sorted(df[col].dropna().unique())
+
+
+def frame_counts(filtered_df):
+    # counts(kolom) untuk DataFrame hasil filter (jalur pandas); jalur SQL memakai SqlTable.counts
+    return lambda col: value_counts(filtered_df[col])
+
+
+def kpis(total, counts):
+    # counts(kolom) -> jumlah per nilai, urut menurun (seri = kemunculan pertama)
+    if total > 0:
+        instansi_counts = counts("Asal Instansi")
+        jenjang_counts = counts("Jenjang")
+        return {
+            "total_peserta": total,
+            "instansi_terbanyak": instansi_counts.idxmax(),
+            "jenjang_terbanyak": jenjang_counts.idxmax(),
+            "instansi_pct": (instansi_counts.max() / total) * 100,
+        }
+    return {"total_peserta": total, "instansi_terbanyak": "-", "jenjang_terbanyak": "-", "instansi_pct": 0}
+
+
+def distribution_tables(counts):
+    # Tabel per grafik, urutan baris sama dengan yang ditampilkan
+    return {
+        "jenjang": share_table(counts("Jenjang"), "Jenjang"),
+        "angkatan": share_table(counts("Tahun Angkatan"), "Tahun Angkatan"),
+        "instansi": share_table(counts("Asal Instansi").sort_values(ascending=True), "Asal Instansi"),
+    }
+
+
+def summarize(df, selections=None):
+    """Semua agregat halaman peserta untuk satu kombinasi filter (default: tanpa filter)."""
+    selections = selections or {}
+    filtered_df = build_filter_index(df).select(df, selections)
+    counts = frame_counts(filtered_df)
+    return {
+        "filter": selections,
+        "kpi": kpis(len(filtered_df), counts),
+        "distribusi": distribution_tables(counts),
+    }
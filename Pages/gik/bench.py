@@ -0,0 +1,321 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PAGES_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def measure(fn, repeat=1):
+    # Waktu terbaik dari `repeat` kali eksekusi (detik) + hasil eksekusi terakhir
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+# =====================
+# TAHAPAN PER HALAMAN
+# =====================
+# Tiap fungsi meniru alur satu halaman (load -> index -> filter -> aggregate -> render)
+# lewat fungsi gik.analytics yang sama dengan halaman Streamlit (tanpa cache & UI),
+# ditambah `summarize` = seluruh agregat halaman sekaligus seperti ekspor CLI.
+def bench_evaluasi(repeat):
+    import plotly.express as px
+
+    from gik.analytics import evaluasi
+    from gik.datasets import load_evaluasi
+    from gik.ingest import dataset_version
+    from gik.render import WordCloudRenderer
+    from gik.scoring import SatisfactionScores
+    from gik.text import Tokenizer
+
+    stages = []
+    df, t = measure(load_evaluasi)
+    stages.append(("load_cold", t))
+    df, t = measure(load_evaluasi, repeat)
+    stages.append(("load_warm", t))
+    version = dataset_version("data_evaluasi")
+
+    def build():
+        tokenizer = Tokenizer()
+        matcher = evaluasi.keyword_matcher()
+        groups = evaluasi.comment_groups(df)
+        return {
+            "tokenizer": tokenizer,
+            "matcher": matcher,
+            "groups": groups,
+            "hits": evaluasi.keyword_hits(df, matcher, groups),
+            "index": evaluasi.build_keyword_index(df),
+            "scores": SatisfactionScores(df),
+            "themes": evaluasi.theme_model(df, tokenizer),
+        }
+
+    built, t = measure(build)
+    stages.append(("index", t))
+
+    def segment():
+        # Analisis Bauran: skor alasan, alasan dominan & komentar bukti per segmen kepuasan
+        scores = built["scores"]
+        out = {}
+        for name, rows, reasons in (
+            ("tinggi", scores.high_rows, evaluasi.REASONS_HIGH),
+            ("rendah", scores.low_rows, evaluasi.REASONS_LOW),
+        ):
+            reason_scores = evaluasi.segment_reason_scores(built["matcher"], built["hits"]["reason"], rows)
+            comments = [
+                evaluasi.relevant_comments(
+                    built["index"], df, rows, evaluasi.REASON_MAP[r], groups=built["groups"]["saran"]
+                )
+                for r in reasons
+            ]
+            out[name] = (evaluasi.dominant_reason(reason_scores, reasons), comments, scores.segment_mean(rows))
+        return out
+
+    _, t = measure(segment, repeat)
+    stages.append(("filter", t))
+
+    def aggregate():
+        tokenizer = built["tokenizer"]
+        dist = evaluasi.indicator_distributions(df)
+        freq = evaluasi.word_frequencies(tokenizer, evaluasi.aspiration_texts(df))
+        phrases = evaluasi.phrase_counter(df, built["scores"], tokenizer)
+        themes = evaluasi.theme_scores(built["themes"])
+        return dist, freq, phrases, themes
+
+    (dist, freq, _, _), t = measure(aggregate, repeat)
+    stages.append(("aggregate", t))
+
+    # Model topik dilatih sekali lalu dibaca dari cache, sama seperti halaman
+    _, t = measure(lambda: evaluasi.topic_summary(df, built["tokenizer"], source=version))
+    stages.append(("topics_cold", t))
+    _, t = measure(lambda: evaluasi.topic_summary(df, built["tokenizer"], source=version), repeat)
+    stages.append(("topics_warm", t))
+
+    def render():
+        renderer = WordCloudRenderer(max_entries=1)
+        png = renderer.render(freq)
+        figs = [
+            px.bar(d["table"], y="Jawaban", x="Jumlah", orientation="h").to_json()
+            for d in dist.values() if d is not None
+        ]
+        return png, figs
+
+    _, t = measure(render)
+    stages.append(("render", t))
+
+    _, t = measure(lambda: evaluasi.summarize(df, Tokenizer(), source=version), repeat)
+    stages.append(("summarize", t))
+    return len(df), stages
+
+
+def bench_pendaftar(repeat):
+    import plotly.express as px
+
+    from gik.analytics import pendaftar
+    from gik.datasets import load_pendaftar
+    from gik.sqlstore import USE_SQL
+
+    stages = []
+    df, t = measure(load_pendaftar)
+    stages.append(("load_cold", t))
+    df, t = measure(load_pendaftar, repeat)
+    stages.append(("load_warm", t))
+
+    def build():
+        # Backend mengikuti GIK_BACKEND, seperti get_timeline/get_count_cube di halaman
+        if USE_SQL:
+            table = pendaftar.build_sql_table(df)
+            return table.timeline(), table
+        timeline = pendaftar.build_timeline(df)
+        return timeline, pendaftar.build_cube(df, timeline)
+
+    (timeline, cube), t = measure(build)
+    stages.append(("index", t))
+
+    # Filter khas: instansi terbanyak + paruh kedua rentang tanggal
+    date_start = timeline.min_date + (timeline.max_date - timeline.min_date) / 2
+    date_end = timeline.max_date
+    between = pendaftar.date_bounds(date_start, date_end)
+    selections = {"Asal Instansi": df["Asal Instansi"].mode().iloc[0]}
+
+    def select():
+        hourly = pendaftar.hourly_counts(cube, timeline, selections)
+        return hourly, hourly.daily()
+
+    (hourly, daily), t = measure(select, repeat)
+    stages.append(("filter", t))
+
+    def aggregate():
+        summary = pendaftar.kpis(cube, daily, selections, date_start, date_end)
+        return {
+            "kpi": summary,
+            "jam": pendaftar.hour_table(hourly, date_start, date_end),
+            "distribusi": pendaftar.distribution_tables(cube, selections, between),
+            "tren": pendaftar.trend_table(hourly, date_start, date_end),
+            "semester": pendaftar.semester_insight(cube, selections, between, summary["total_pendaftar"]),
+        }
+
+    built, t = measure(aggregate, repeat)
+    stages.append(("aggregate", t))
+
+    def render():
+        figs = [
+            px.bar(table, x=table.columns[0], y="Jumlah").to_json()
+            for table in built["distribusi"].values()
+        ]
+        figs.append(px.bar(built["jam"], x="Jam", y="Jumlah").to_json())
+        figs.append(px.line(built["tren"], x="Timestamp", y="Jumlah").to_json())
+        return figs
+
+    _, t = measure(render)
+    stages.append(("render", t))
+
+    _, t = measure(lambda: pendaftar.summarize(df, selections, date_start, date_end), repeat)
+    stages.append(("summarize", t))
+    return len(df), stages
+
+
+def bench_peserta(repeat):
+    from functools import partial
+
+    import plotly.express as px
+
+    from gik.analytics import peserta
+    from gik.datasets import load_peserta
+    from gik.sqlstore import USE_SQL
+
+    stages = []
+    df, t = measure(load_peserta)
+    stages.append(("load_cold", t))
+    df, t = measure(load_peserta, repeat)
+    stages.append(("load_warm", t))
+
+    build = peserta.build_sql_table if USE_SQL else peserta.build_filter_index
+    index, t = measure(lambda: build(df))
+    stages.append(("index", t))
+
+    selections = {"Jenjang": "S1"}
+
+    def select():
+        if USE_SQL:
+            return index.total(selections), partial(index.counts, selections=selections)
+        filtered = index.select(df, selections)
+        return len(filtered), peserta.frame_counts(filtered)
+
+    (total, counts), t = measure(select, repeat)
+    stages.append(("filter", t))
+
+    def aggregate():
+        return peserta.kpis(total, counts), peserta.distribution_tables(counts)
+
+    (_, tables), t = measure(aggregate, repeat)
+    stages.append(("aggregate", t))
+
+    def render():
+        return [px.bar(table, x=table.columns[0], y="Jumlah").to_json() for table in tables.values()]
+
+    _, t = measure(render)
+    stages.append(("render", t))
+
+    _, t = measure(lambda: peserta.summarize(df, selections), repeat)
+    stages.append(("summarize", t))
+    return len(df), stages
+
+
+PAGES = {
+    "evaluasi": bench_evaluasi,
+    "dashboard_pendaftar": bench_pendaftar,
+    "dashboard_peserta": bench_peserta,
+}
+
+
+# =====================
+# WORKER & RUNNER
+# =====================
+def run_worker(repeat):
+    # Dijalankan di subprocess dengan GIK_DATA_DIR/GIK_CACHE_DIR mengarah ke data sintetis
+    results = []
+    for page, bench in PAGES.items():
+        rows, stages = bench(repeat)
+        results.extend(
+            {"page": page, "stage": stage, "rows": rows, "seconds": round(seconds, 6)}
+            for stage, seconds in stages
+        )
+    return results
+
+
+def run(sizes, repeat=3, seed=0, keep_dir=None):
+    """Bangkitkan data sintetis untuk tiap ukuran lalu ukur semua halaman.
+
+    Setiap ukuran dijalankan di proses terpisah (cache & memori bersih).
+    """
+    from gik.sqlstore import BACKEND
+    from gik.synth import write_datasets
+
+    results = []
+    for n_rows in sizes:
+        data_dir = Path(keep_dir) / str(n_rows) if keep_dir else Path(tempfile.mkdtemp(prefix="gik_bench_"))
+        try:
+            write_datasets(data_dir, n_rows, seed=seed)
+            cache_dir = data_dir / ".cache"
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            env = {**os.environ, "GIK_DATA_DIR": str(data_dir), "GIK_CACHE_DIR": str(cache_dir)}
+            proc = subprocess.run(
+                [sys.executable, "-m", "gik.bench", "--worker", "--repeat", str(repeat)],
+                cwd=PAGES_DIR, env=env, capture_output=True, text=True, check=True
+            )
+            for row in json.loads(proc.stdout):
+                results.append({"size": n_rows, **row})
+        finally:
+            if not keep_dir:
+                shutil.rmtree(data_dir, ignore_errors=True)
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "backend": BACKEND,
+        "repeat": repeat,
+        "sizes": list(sizes),
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    # python -m gik.bench --sizes 1000 100000 1000000 --out bench.json  (dari folder Pages)
+    parser = argparse.ArgumentParser(description="Benchmark skala dashboard GIKnowledge")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--keep-data", help="simpan CSV sintetis di folder ini")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.repeat)))
+        sys.exit(0)
+
+    report = run(args.sizes, repeat=args.repeat, seed=args.seed, keep_dir=args.keep_data)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    table = pd.DataFrame(report["results"]).pivot_table(
+        index=["page", "stage"], columns="size", values="seconds", sort=False
+    )
+    print(table.round(4).to_string())
+    print(f"\nHasil disimpan di {args.out}")
@@ -0,0 +1,94 @@
+import argparse
+import datetime
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from gik.analytics.common import to_jsonable
+
+DASHBOARDS = ["evaluasi", "pendaftar", "peserta"]
+
+
+# =====================
+# HITUNG SEMUA AGREGAT
+# =====================
+def compute(dashboards=DASHBOARDS):
+    # Import per dashboard agar hanya dependensi yang dipakai yang dimuat
+    summaries = {}
+    if "evaluasi" in dashboards:
+        from gik.analytics import evaluasi
+        from gik.datasets import load_evaluasi
+        from gik.ingest import dataset_version
+        from gik.text import Tokenizer
+
+        summaries["evaluasi"] = evaluasi.summarize(
+            load_evaluasi(), Tokenizer(), source=dataset_version("data_evaluasi")
+        )
+    if "pendaftar" in dashboards:
+        from gik.analytics import pendaftar
+        from gik.datasets import load_pendaftar
+
+        summaries["pendaftar"] = pendaftar.summarize(load_pendaftar())
+    if "peserta" in dashboards:
+        from gik.analytics import peserta
+        from gik.datasets import load_peserta
+
+        summaries["peserta"] = peserta.summarize(load_peserta())
+    return summaries
+
+
+def iter_tables(value, path=()):
+    # Semua DataFrame di dalam ringkasan beserta path kuncinya
+    if isinstance(value, pd.DataFrame):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from iter_tables(item, path + (str(key),))
+
+
+# =====================
+# EKSPOR
+# =====================
+def export(out_dir, dashboards=DASHBOARDS, formats=("json", "parquet")):
+    """Tulis ringkasan ke `summary.json` dan/atau satu Parquet per tabel.
+
+    Mengembalikan daftar file yang ditulis.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summaries = compute(dashboards)
+    written = []
+
+    if "json" in formats:
+        path = out_dir / "summary.json"
+        payload = {
+            "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+            **to_jsonable(summaries),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        written.append(path)
+
+    if "parquet" in formats:
+        for (dashboard, *keys), table in iter_tables(summaries):
+            path = out_dir / dashboard / ("__".join(keys) + ".parquet")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table.to_parquet(path, index=False)
+            written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gik", description="Analitik GIKnowledge tanpa Streamlit")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = commands.add_parser("export", help="hitung agregat semua dashboard lalu tulis JSON/Parquet")
+    export_cmd.add_argument("--out", required=True, help="folder output")
+    export_cmd.add_argument("--dashboard", choices=DASHBOARDS, nargs="+", default=DASHBOARDS)
+    export_cmd.add_argument("--format", choices=["json", "parquet"], nargs="+", default=["json", "parquet"])
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        for path in export(args.out, args.dashboard, args.format):
+            print(path)
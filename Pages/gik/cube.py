@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from gik.filters import BitmapIndex
+from gik.instrument import timed
+
+
+# =====================
+# COUNT CUBE
+# =====================
+class CountCube:
+    """Kubus jumlah baris per kombinasi dimensi, dibangun sekali saat load.
+
+    Setiap sel menyimpan `count` dan `first` (posisi baris pertama). `counts()`
+    urut jumlah menurun; jumlah yang seri diurutkan menurut kemunculan pertama
+    (data pendaftar terurut Timestamp -> urutan waktu). Ini berbeda dengan
+    `value_counts()` pandas (seri mengikuti urutan hash), jadi pemenang seri bisa
+    berbeda dari versi awal halaman; schema.value_counts & SqlTable memakai aturan
+    yang sama (lihat tests/test_tie_order.py).
+    Filter dijawab dengan BitmapIndex di atas sel, bukan di atas baris. Sel
+    terurut menurut dimensi pertama, sehingga rentang nilai dimensi tersebut
+    (mis. hari) dijawab dengan binary search lewat `between`.
+    """
+
+    def __init__(self, dimensions):
+        # dimensions: dict {nama_dimensi: Series/array nilai per baris}
+        keys = pd.DataFrame({name: np.asarray(values) for name, values in dimensions.items()})
+        self.dimensions = list(dimensions)
+        self.n_rows = len(keys)
+        self.cells = (
+            keys.assign(_row=np.arange(len(keys)))
+            .groupby(self.dimensions, sort=True, dropna=False)
+            .agg(count=("_row", "size"), first=("_row", "min"))
+            .reset_index()
+        )
+        self.index = BitmapIndex({name: self.cells[name] for name in self.dimensions})
+        self._leading = self.cells[self.dimensions[0]].to_numpy()
+
+    def select(self, selections, between=None):
+        # between = (awal, akhir) inklusif pada dimensi pertama
+        rows = self.index.rows(selections) if selections else None
+        if between is not None:
+            lo = np.searchsorted(self._leading, between[0], side="left")
+            hi = np.searchsorted(self._leading, between[1], side="right")
+            if rows is None:
+                return self.cells.iloc[lo:hi]
+            rows = rows[(rows >= lo) & (rows < hi)]
+        if rows is None:
+            return self.cells
+        return self.cells.take(rows)
+
+    def total(self, selections, between=None):
+        return int(self.select(selections, between)["count"].sum())
+
+    @timed("cube.counts")
+    def counts(self, dim, selections, between=None):
+        # Jumlah per nilai `dim` untuk baris yang lolos filter: urut jumlah menurun, seri = kemunculan pertama
+        grouped = (
+            self.select(selections, between)
+            .groupby(dim, sort=False)
+            .agg(count=("count", "sum"), first=("first", "min"))
+            .sort_values("first", kind="stable")
+        )
+        return grouped["count"].sort_values(ascending=False, kind="stable")
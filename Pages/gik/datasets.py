@@ -0,0 +1,167 @@
+import pandas as pd
+
+from gik.ingest import load_prepared
+from gik.instansi import InstansiNormalizer, alias_version
+from gik.jenjang import JENJANG_LEVELS, classify_jenjang
+from gik.likert import ANSWER_ORDER
+from gik.schema import CATEGORY, DATETIME, TEXT, apply_schema
+
+# Naikkan versi jika logika pembersihan atau skema di bawah berubah agar cache Arrow dibangun ulang
+EVALUASI_VERSION = "3"
+PENDAFTAR_VERSION = "4"
+PESERTA_VERSION = "4"
+
+
+def with_schema(prepare, schema, default=None):
+    # Pembersihan lalu penerapan skema tipe kolom (lihat gik/schema.py)
+    return lambda df: apply_schema(prepare(df), schema, default)
+
+# =====================
+# EVALUASI
+# =====================
+EVALUASI_COLUMNS = {
+    '5.1. Seberapa puas Anda terhadap Anda menilai kemampuan mentor dalam menjelaskan materi?': 'puas_mentor',
+    '5.4. Seberapa puas Anda terhadap metode pembelajaran yang digunakan oleh mentor?': 'puas_metode',
+    '5.5. Seberapa puas Anda terhadap materi kelas Program GIKnowledge Building 2025?': 'puas_materi',
+    '5.7. Apakah materi dan kegiatan yang diberikan sesuai dengan kebutuhan pengembangan Anda?': 'sesuai_kebutuhan',
+    '5.8. Apakah Program GIKnowledge Building membantu Anda memahami hal-hal baru yang relevan dengan rencana pekerjaan atau karier Anda?': 'relevan_karier',
+    '5.9. Apakah Anda merasa lebih percaya diri setelah mengikuti program ini?': 'percaya_diri',
+    '5.10. Sejauh mana program ini memberi dampak positif bagi cara Anda bekerja, berpikir, atau berkolaborasi?': 'dampak_positif',
+    '5.11. Bagaimana pendapat Anda tentang jadwal dan durasi setiap sesi?': 'jadwal_durasi',
+    '5.12. Seberapa puas Anda terhadap fasilitas kelas GIKnowledge Building 2025?': 'puas_fasilitas',
+    '5.14. Seberapa puas Anda terhadap Tim GIK dalam memberikan bimbingan dan dukungan yang cukup selama  penyelenggaraan Program GIKnowledge Building 2025?': 'puas_tim',
+    '5.19. Berdasarkan level kepuasanmu terhadap keseluruhan pelaksanaan program sejauh ini, seberapa mungkin Anda memberi rekomendasi ke teman atau mahasiswa lain untuk mengikuti Program GIKnowledge Building?': 'rekomendasi',
+    '5.16. Apa manfaat utama yang Anda rasakan setelah mengikuti program ini?': 'manfaat',
+    '5.17. Apa hal terbaik dari Program GIKnowledge Building 2025 yang sebaiknya dipertahankan?': 'dipertahankan',
+    '5.18. Apakah ada topik, metode, atau aktivitas baru yang ingin Anda tambahkan pada pelaksanaan selanjutnya?': 'harapan',
+    '5.20. Jika Anda menjawab "Sangat direkomendasikan", atau "Direkomendasikan" pada pertanyaan sebelumnya, Berikan alasan mengapa Anda bersedia merekomendasikan program GIKnowledge Building ini kepada teman atau mahasiswa lain?': 'alasan_rekomendasi',
+    '5.21. Ceritakan pengalaman berkesan selama Anda mengikuti Program GIKnowledge Building!': 'pengalaman',
+    '5.22. Berikan saran perbaikan untuk pengembangan dan keberlanjutan Program GIKnowledge Building!': 'saran'
+}
+
+# Indikator kuantitatif (jawaban tertutup/Likert)
+EVALUASI_LIKERT_COLUMNS = [
+    "puas_mentor", "puas_metode", "puas_materi", "sesuai_kebutuhan", "relevan_karier",
+    "percaya_diri", "dampak_positif", "jadwal_durasi", "puas_fasilitas", "puas_tim", "rekomendasi"
+]
+
+# Kolom jawaban terbuka (teks bebas) yang di-index untuk pencarian kata kunci
+EVALUASI_TEXT_COLUMNS = ["saran", "harapan", "manfaat", "dipertahankan", "alasan_rekomendasi", "pengalaman"]
+
+
+def prepare_evaluasi(df):
+    df.columns = df.columns.str.strip()
+    return df.rename(columns=EVALUASI_COLUMNS)
+
+
+# Likert -> categorical berurutan ANSWER_ORDER; kolom lain (jawaban terbuka) -> Arrow string
+EVALUASI_SCHEMA = {col: ANSWER_ORDER for col in EVALUASI_LIKERT_COLUMNS}
+
+
+def load_evaluasi():
+    prepare = with_schema(prepare_evaluasi, EVALUASI_SCHEMA, default=TEXT)
+    return load_prepared("data_evaluasi", prepare, EVALUASI_VERSION)
+
+
+# =====================
+# PENDAFTAR
+# =====================
+SEMESTER_COL = (
+    'Semester kuliah bagi mahasiswa aktif ketika mengikuti Program '
+    'GIKnowledge Building (di semester ganjil tahun ajaran 2025/2026)?'
+)
+
+
+def prepare_pendaftar(df):
+    df['Timestamp'] = pd.to_datetime(df['Timestamp'])
+
+    def clean_text(series):
+        return series.astype(str).str.strip().str.lower()
+
+    df['Asal Instansi'] = clean_text(df['Asal Instansi'])
+    df['Jenjang pendidikan asal'] = clean_text(df['Jenjang pendidikan asal'])
+    df['Jenis kelamin'] = clean_text(df['Jenis kelamin'])
+    df[SEMESTER_COL] = clean_text(df[SEMESTER_COL])
+
+    df['Asal Instansi'] = InstansiNormalizer.from_csv().normalize(df['Asal Instansi'])
+
+    # Disimpan terurut menurut waktu agar rentang tanggal bisa dicari dengan binary search
+    return df.sort_values('Timestamp', kind='stable').reset_index(drop=True)
+
+
+# Kolom pilihan tertutup -> categorical; pertanyaan terbuka (sumber info, motivasi) -> Arrow string
+PENDAFTAR_SCHEMA = {
+    'Timestamp': DATETIME,
+    'Asal Instansi': CATEGORY,
+    'Jenis kelamin': CATEGORY,
+    'Fakultas/sekolah asal': CATEGORY,
+    'Prodi asal': CATEGORY,
+    'Jenjang pendidikan asal': CATEGORY,
+    SEMESTER_COL: CATEGORY,
+}
+
+
+def load_pendaftar():
+    prepare = with_schema(prepare_pendaftar, PENDAFTAR_SCHEMA, default=TEXT)
+    return load_prepared("data_pendaftar", prepare, f"{PENDAFTAR_VERSION}+{alias_version()}")
+
+
+# =====================
+# PESERTA
+# =====================
+def prepare_peserta(df):
+    df.columns = df.columns.str.strip()
+
+    def clean_text(series):
+        return series.astype(str).str.strip()
+
+    if 'Asal Instansi' in df.columns:
+        df['Asal Instansi'] = clean_text(df['Asal Instansi']).str.lower()
+
+    if 'Jenis Kelamin' in df.columns:
+        df['Jenis Kelamin'] = clean_text(df['Jenis Kelamin']).str.title()
+
+    if 'Fakultas/Sekolah Asal' in df.columns:
+        df['Fakultas/Sekolah Asal'] = clean_text(df['Fakultas/Sekolah Asal']).str.title()
+
+    if 'Prodi Asal' in df.columns:
+        df['Prodi Asal'] = clean_text(df['Prodi Asal']).str.title()
+
+    if 'Semester' in df.columns:
+        df['Semester'] = clean_text(df['Semester'])
+
+    if 'Asal Instansi' in df.columns:
+        df['Asal Instansi'] = InstansiNormalizer.from_csv().normalize(df['Asal Instansi'])
+
+    if 'Prodi Asal' in df.columns:
+        # Klasifikasi vektor (lihat gik/jenjang.py), disimpan sebagai categorical
+        df['Jenjang'] = classify_jenjang(df['Prodi Asal'], df.get('Fakultas/Sekolah Asal'))
+    else:
+        df['Jenjang'] = 'Lainnya'
+
+    if 'Semester' in df.columns:
+        df['Tahun Angkatan'] = df['Semester']
+    else:
+        df['Tahun Angkatan'] = 'N/A'
+
+    return df
+
+
+# Semua kolom peserta berkosakata tertutup -> categorical
+PESERTA_SCHEMA = {'Jenjang': JENJANG_LEVELS}
+
+
+def load_peserta():
+    prepare = with_schema(prepare_peserta, PESERTA_SCHEMA, default=CATEGORY)
+    return load_prepared("data_peserta", prepare, f"{PESERTA_VERSION}+{alias_version()}")
+
+
+# =====================
+# REGISTRI DATASET
+# =====================
+# nama file -> (pembersihan, skema, jenis default); dipakai laporan memori `python -m gik.schema`
+DATASETS = {
+    "data_evaluasi": (prepare_evaluasi, EVALUASI_SCHEMA, TEXT),
+    "data_pendaftar": (prepare_pendaftar, PENDAFTAR_SCHEMA, TEXT),
+    "data_peserta": (prepare_peserta, PESERTA_SCHEMA, CATEGORY),
+}
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+
+from gik.instrument import timed
+from gik.text import NON_ALPHA
+
+# MinHash LSH atas shingle 3 karakter: 64 permutasi = 16 band x 4 baris (kandidat mulai ~Jaccard 0.5)
+NUM_PERM = 64
+BANDS = 16
+SHINGLE_SIZE = 3
+SIMILARITY = 0.6        # estimasi Jaccard minimum agar dua grup dianggap serupa
+_PRIME = (1 << 31) - 1
+_CHUNK = 200_000        # jumlah shingle per potongan saat menghitung signature
+
+
+def normalize(text):
+    # Bentuk yang menghasilkan token persis sama dengan teks aslinya (lihat Tokenizer)
+    return " ".join(NON_ALPHA.sub(" ", str(text).lower()).split())
+
+
+# Huruf teks normal -> digit basis 27 (spasi = 0, a-z = 1-26)
+_DIGIT = np.zeros(256, dtype=np.int64)
+_DIGIT[ord("a"):ord("z") + 1] = np.arange(1, 27)
+
+
+def shingle_codes(texts, k=SHINGLE_SIZE):
+    """Shingle k karakter semua teks ter-normalisasi sebagai bilangan bulat < 27^k.
+
+    Teks normal hanya berisi a-z dan spasi, jadi tiap shingle dapat dikodekan
+    persis tanpa hashing. Shingle ganda tidak perlu dibuang karena MinHash
+    hanya mengambil nilai minimum.
+    Mengembalikan (kode, posisi awal tiap teks); teks ke-j = kode[awal[j]:awal[j + 1]].
+    """
+    padded = [f" {t} ".ljust(k) for t in texts]
+    lengths = np.fromiter(map(len, padded), dtype=np.int64, count=len(padded))
+    digits = _DIGIT[np.frombuffer("".join(padded).encode("ascii"), dtype=np.uint8)]
+
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    counts = lengths - k + 1
+    starts = np.concatenate([[0], np.cumsum(counts)])
+    # Posisi awal setiap shingle di buffer gabungan (tidak melintasi batas teks)
+    pos = np.repeat(offsets[:-1] - starts[:-1], counts) + np.arange(starts[-1])
+
+    codes = np.zeros(len(pos), dtype=np.int64)
+    for i in range(k):
+        codes = codes * 27 + digits[pos + i]
+    return codes, starts
+
+
+def minhash_signatures(codes, starts, num_perm=NUM_PERM, k=SHINGLE_SIZE, seed=0):
+    """Signature MinHash (teks x num_perm) dengan hash universal (a * x + b) mod p."""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _PRIME, num_perm, dtype=np.int64)
+    b = rng.integers(0, _PRIME, num_perm, dtype=np.int64)
+    # Ruang kode kecil (27^k), jadi hash semua kode dihitung sekali sebagai tabel kode x permutasi
+    table = ((np.arange(27 ** k, dtype=np.int64)[:, None] * a + b) % _PRIME).astype(np.uint32)
+
+    n = len(starts) - 1
+    signatures = np.empty((n, num_perm), dtype=np.uint32)
+    # Diproses per potongan teks agar matriks hash sementara tetap kecil
+    g = 0
+    while g < n:
+        end = max(int(np.searchsorted(starts, starts[g] + _CHUNK, side="right")) - 1, g + 1)
+        lo, hi = starts[g], starts[end]
+        signatures[g:end] = np.minimum.reduceat(table[codes[lo:hi]], starts[g:end] - lo, axis=0)
+        g = end
+    return signatures
+
+
+# =====================
+# GRUP KOMENTAR
+# =====================
+class CommentGroups:
+    """Pengelompokan jawaban teks bebas dua tingkat.
+
+    - Grup tepat: baris dengan teks ter-normalisasi sama -> token identik,
+      disimpan sekali dengan bobot = jumlah baris (`texts`, `weights`).
+      Menghitung per grup x bobot = hasil hitung per baris.
+    - Klaster mirip (`clusters`): grup dengan teks hampir sama (MinHash LSH
+      atas shingle karakter), untuk meringkas tampilan komentar.
+
+    Urutan grup = urutan kemunculan pertama di data.
+    """
+
+    @timed("dedup")
+    def __init__(self, texts, similarity=SIMILARITY, num_perm=NUM_PERM, bands=BANDS):
+        values = pd.Series(texts, dtype=object).reset_index(drop=True)
+        mask = values.notna().to_numpy()
+        raw_codes, raw_uniques = pd.factorize(values[mask].astype(str))
+        codes, texts = pd.factorize(pd.Series([normalize(t) for t in raw_uniques], dtype=object))
+        codes = codes[raw_codes]
+        self.texts = texts.tolist()
+
+        self.group = np.full(len(values), -1, dtype=np.int64)
+        self.group[mask] = codes
+        self.weights = np.bincount(codes, minlength=len(self.texts))
+        self.similarity = similarity
+        self.num_perm = num_perm
+        self.bands = bands
+        self._clusters = None
+        self._row_clusters = None
+
+    def __len__(self):
+        return len(self.texts)
+
+    @property
+    def clusters(self):
+        # Id klaster per grup (= grup pertama di klaster), dihitung saat pertama dibutuhkan
+        if self._clusters is None:
+            self._clusters = self._cluster()
+        return self._clusters
+
+    def _cluster(self):
+        """Klaster greedy berbasis LSH tanpa efek berantai.
+
+        Grup diproses berurutan; tiap grup bergabung ke representatif pertama
+        yang berbagi bucket band dengannya dan estimasi Jaccard-nya (porsi
+        signature yang sama) >= `similarity`. Jika tidak ada, grup menjadi
+        representatif baru. Id klaster = posisi grup representatif.
+        """
+        n = len(self.texts)
+        clusters = np.arange(n)
+        if n < 2:
+            return clusters
+        signatures = minhash_signatures(*shingle_codes(self.texts), self.num_perm)
+        rows = self.num_perm // self.bands
+
+        # Bucket per band (dibuat unik antar band dengan offset band * n)
+        buckets = np.empty((n, self.bands), dtype=np.int64)
+        for band in range(self.bands):
+            key = pd.DataFrame(signatures[:, band * rows:(band + 1) * rows])
+            buckets[:, band] = key.groupby(list(key.columns), sort=False).ngroup().to_numpy() + band * n
+
+        rep_of_bucket = {}
+        for i, keys in enumerate(buckets.tolist()):
+            chosen = i
+            tried = set()
+            for key in keys:
+                rep = rep_of_bucket.get(key)
+                if rep is None or rep in tried:
+                    continue
+                tried.add(rep)
+                if np.count_nonzero(signatures[i] == signatures[rep]) >= self.similarity * self.num_perm:
+                    chosen = rep
+                    break
+            clusters[i] = chosen
+            for key in keys:
+                rep_of_bucket.setdefault(key, chosen)
+        return clusters
+
+    def row_clusters(self):
+        # Id klaster per baris (-1 untuk jawaban kosong)
+        if self._row_clusters is None:
+            out = np.full(len(self.group), -1, dtype=np.int64)
+            answered = self.group >= 0
+            out[answered] = self.clusters[self.group[answered]]
+            self._row_clusters = out
+        return self._row_clusters
+
+    def row_texts(self):
+        # Teks ter-normalisasi per baris ("" untuk jawaban kosong)
+        return np.array(self.texts + [""], dtype=object)[self.group]
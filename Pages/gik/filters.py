@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from gik.instrument import timed
+
+
+# =====================
+# BITMAP FILTER INDEX
+# =====================
+class BitmapIndex:
+    """Satu bitmap (boolean yang di-pack per 8 baris) untuk setiap nilai unik kolom filter.
+
+    Filter dijawab dengan OR bitmap dalam satu kolom lalu AND antar kolom,
+    kemudian hanya baris yang lolos yang diambil dari DataFrame.
+    """
+
+    def __init__(self, columns):
+        # columns: dict {nama_filter: Series/array nilai per baris}
+        self.n_rows = None
+        self.bitmaps = {}
+        for name, values in columns.items():
+            codes, uniques = pd.factorize(pd.Series(values), sort=True)
+            if self.n_rows is None:
+                self.n_rows = len(codes)
+            self.bitmaps[name] = {
+                key: np.packbits(codes == i) for i, key in enumerate(uniques.tolist())
+            }
+
+    def keys(self, name):
+        return list(self.bitmaps[name])
+
+    def _column_mask(self, name, selection):
+        bitmaps = self.bitmaps[name]
+        if callable(selection):
+            keys = [k for k in bitmaps if selection(k)]
+        elif isinstance(selection, (list, tuple, set, frozenset)):
+            keys = [k for k in selection if k in bitmaps]
+        else:
+            keys = [selection] if selection in bitmaps else []
+
+        if not keys:
+            return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        if len(keys) == 1:
+            return bitmaps[keys[0]]
+        return np.bitwise_or.reduce([bitmaps[k] for k in keys])
+
+    def rows(self, selections):
+        # selections: {nama_filter: nilai | list nilai | predicate(nilai) -> bool}
+        mask = None
+        for name, selection in selections.items():
+            col_mask = self._column_mask(name, selection)
+            mask = col_mask if mask is None else mask & col_mask
+        if mask is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(np.unpackbits(mask, count=self.n_rows))
+
+    @timed("bitmap.select")
+    def select(self, df, selections):
+        # Tanpa filter aktif kembalikan frame yang sama (tanpa copy)
+        if not selections:
+            return df
+        return df.take(self.rows(selections))
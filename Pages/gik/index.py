@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from gik.instrument import timed
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+# =====================
+# INVERTED INDEX
+# =====================
+class InvertedIndex:
+    """Index token -> posisi baris responden untuk kolom teks bebas.
+
+    Token = potongan teks huruf kecil yang dipisah spasi, sehingga kata kunci
+    tanpa spasi cocok dengan token yang mengandungnya persis seperti
+    `keyword in text.lower()`. Posisi baris selalu terurut (urutan data asli).
+    """
+
+    def __init__(self, postings, n_rows):
+        self.postings = postings
+        self.n_rows = n_rows
+        self._vocab = {col: pd.Index(list(p.keys()), dtype=object) for col, p in postings.items()}
+        self._resolved = {}
+
+    @classmethod
+    def build(cls, df, columns):
+        postings = {}
+        for col in columns:
+            values = pd.Series(df[col].to_numpy(), index=np.arange(len(df)))
+            words = values.dropna().astype(str).str.lower().str.split().explode().dropna()
+            pairs = (
+                pd.DataFrame({"token": words.to_numpy(), "row": words.index.to_numpy()})
+                .drop_duplicates()
+                .sort_values(["token", "row"], kind="stable")
+            )
+            tokens = pairs["token"].to_numpy()
+            rows = pairs["row"].to_numpy(dtype=np.int64)
+            if len(tokens) == 0:
+                postings[col] = {}
+                continue
+            starts = np.flatnonzero(np.r_[True, tokens[1:] != tokens[:-1]])
+            postings[col] = dict(zip(tokens[starts], np.split(rows, starts[1:])))
+        return cls(postings, len(df))
+
+    def _tokens_for(self, col, keyword):
+        # Token yang mengandung keyword (semantik substring), dihitung sekali per keyword
+        key = (col, keyword)
+        if key not in self._resolved:
+            vocab = self._vocab[col]
+            self._resolved[key] = vocab[vocab.str.contains(keyword, regex=False)].tolist()
+        return self._resolved[key]
+
+    def rows_matching(self, col, keywords):
+        postings = self.postings[col]
+        hits = [postings[t] for k in keywords for t in self._tokens_for(col, k)]
+        if not hits:
+            return _EMPTY
+        return np.unique(np.concatenate(hits))
+
+    @timed("index.lookup")
+    def lookup(self, col, keywords, rows=None):
+        hits = self.rows_matching(col, keywords)
+        if rows is not None:
+            hits = np.intersect1d(hits, np.asarray(rows, dtype=np.int64), assume_unique=False)
+        return hits
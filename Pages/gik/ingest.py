@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from gik.instrument import stage
+from gik.schema import read_arrow, write_arrow
+
+# =====================
+# PATH DATA & CACHE
+# =====================
+# Path dihitung dari lokasi file ini agar tidak bergantung pada working directory
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DATA_DIR = Path(os.environ.get("GIK_DATA_DIR", ROOT_DIR / "data"))
+CACHE_DIR = Path(os.environ.get("GIK_CACHE_DIR", DATA_DIR / ".cache"))
+
+
+# =====================
+# HELPER FUNCTIONS
+# =====================
+def file_hash(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_meta(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path, write):
+    # Tulis ke file sementara lalu rename, supaya sesi lain tidak membaca file setengah jadi
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _write_meta(path, meta):
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+    _write_atomic(path, write)
+
+
+def dataset_version(name):
+    # Penanda versi yang murah (mtime + ukuran CSV) untuk kunci cache per dataset
+    stat = (DATA_DIR / f"{name}.csv").stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+# =====================
+# LOAD PREPARED TABLE
+# =====================
+def load_prepared(name, prepare, version):
+    """Baca `data/<name>.csv` lewat cache Arrow IPC yang sudah dibersihkan (memory-mapped).
+
+    Cache dibangun ulang jika `version` (versi logika `prepare`) berubah atau isi
+    CSV berubah. Mtime dicek lebih dulu; hash SHA-256 hanya dihitung jika mtime
+    berbeda, sehingga file yang sekadar di-touch tidak memicu parsing ulang.
+    Nama file cache memuat hash isi, jadi file yang sedang di-map sesi lain tidak
+    pernah ditimpa; file lama dihapus saat cache dibangun ulang.
+    """
+    src = DATA_DIR / f"{name}.csv"
+    meta_path = CACHE_DIR / f"{name}.meta.json"
+
+    stat = src.stat()
+    meta = _read_meta(meta_path)
+    out = CACHE_DIR / meta.get("file", f"{name}.arrow")
+    digest = None
+
+    if out.exists() and meta.get("version") == version:
+        if meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+            return read_arrow(out)
+
+        digest = file_hash(src)
+        if meta.get("sha256") == digest:
+            meta.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            _write_meta(meta_path, meta)
+            return read_arrow(out)
+
+    if digest is None:
+        digest = file_hash(src)
+
+    with stage("csv_load") as record:
+        raw = pd.read_csv(src)
+        record["rows"] = len(raw)
+    with stage("prepare", rows=len(raw)):
+        df = prepare(raw)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    key = hashlib.sha256(f"{version}:{digest}".encode()).hexdigest()[:12]
+    out = CACHE_DIR / f"{name}.{key}.arrow"
+    _write_atomic(out, lambda tmp: write_arrow(df, tmp))
+    _write_meta(meta_path, {
+        "source": src.name,
+        "file": out.name,
+        "version": version,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "rows": len(df),
+    })
+
+    _remove_stale(name, keep=out)
+
+    # Selalu kembalikan hasil baca cache agar tipe data sama antara cold & warm start
+    return read_arrow(out)
+
+
+def _remove_stale(name, keep):
+    # Cache versi lama (Arrow + DB SQLite turunannya, termasuk format Parquet sebelumnya); file
+    # yang masih di-map proses lain di Windows tidak bisa dihapus dan dicoba lagi di rebuild berikutnya
+    stale = [*CACHE_DIR.glob(f"{name}.*.arrow"), *CACHE_DIR.glob(f"{name}.*.sqlite"), CACHE_DIR / f"{name}.parquet"]
+    for path in stale:
+        if not path.name.startswith(f"{keep.stem}."):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
@@ -0,0 +1,54 @@
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gik.ingest import ROOT_DIR, file_hash
+from gik.instrument import timed
+
+# Tabel alias: regex (dicocokkan pada nama huruf kecil) -> nama kanonik, aturan pertama yang cocok menang
+ALIAS_PATH = Path(os.environ.get("GIK_INSTANSI_ALIAS", ROOT_DIR / "data" / "instansi_alias.csv"))
+
+
+# =====================
+# NORMALISASI INSTANSI
+# =====================
+class InstansiNormalizer:
+    """Normalisasi nama instansi berbasis tabel alias.
+
+    Setiap ejaan unik hanya di-resolve sekali (hasil disimpan), lalu seluruh
+    kolom dipetakan lewat kode hasil factorize. Nama yang tidak cocok dengan
+    alias mana pun dikembalikan dalam Title Case.
+    """
+
+    def __init__(self, rules):
+        self.rules = [(re.compile(pattern), canonical) for pattern, canonical in rules]
+        self._resolved = {}
+
+    @classmethod
+    def from_csv(cls, path=ALIAS_PATH):
+        table = pd.read_csv(path, dtype=str, keep_default_na=False)
+        return cls(zip(table["pattern"], table["canonical"]))
+
+    def resolve(self, name):
+        if not isinstance(name, str):
+            return name
+        if name not in self._resolved:
+            key = name.strip().lower()
+            match = next((canonical for rx, canonical in self.rules if rx.search(key)), None)
+            self._resolved[name] = match if match is not None else name.title()
+        return self._resolved[name]
+
+    @timed("normalize_instansi")
+    def normalize(self, series):
+        codes, uniques = pd.factorize(series)
+        mapped = np.array([self.resolve(u) for u in uniques] + [np.nan], dtype=object)
+        # Kode -1 (nilai kosong) menunjuk ke elemen terakhir (NaN)
+        return pd.Series(mapped[codes], index=series.index, name=series.name)
+
+
+def alias_version(path=ALIAS_PATH):
+    # Ikut dimasukkan ke versi cache agar perubahan tabel alias memicu rebuild
+    return file_hash(path)[:12]
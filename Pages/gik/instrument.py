@@ -0,0 +1,155 @@
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+# Log JSONL (satu baris per tahap per rerun), opsional: GIK_PERF_LOG=logs/perf.jsonl
+LOG_PATH = Path(os.environ["GIK_PERF_LOG"]) if os.environ.get("GIK_PERF_LOG") else None
+# Di atas ukuran ini log lama diputar ke <nama>.1 (satu generasi disimpan)
+LOG_MAX_BYTES = int(os.environ.get("GIK_PERF_LOG_MAX_BYTES") or 10 * 1024 * 1024)
+
+# Recorder & tumpukan tahap aktif per thread (Streamlit menjalankan tiap sesi di thread sendiri)
+_local = threading.local()
+
+
+# =====================
+# RECORDER PER RERUN
+# =====================
+class Recorder:
+    """Catatan waktu per tahap untuk satu kali eksekusi script halaman.
+
+    Membuat Recorder menjadikannya aktif di thread ini, sehingga `stage()` dan
+    `timed()` di modul gik mana pun ikut tercatat. Tanpa Recorder aktif,
+    keduanya tidak melakukan apa-apa.
+
+    Log ditulis setiap kali tahap teratas selesai (termasuk saat dihentikan
+    st.rerun/st.stop/exception), jadi rerun yang berhenti lebih awal tetap
+    tercatat tanpa perlu blok khusus di halaman.
+    """
+
+    def __init__(self, page, log_path=LOG_PATH):
+        self.page = page
+        self.log_path = log_path
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = datetime.datetime.now().isoformat(timespec="seconds")
+        self.records = []
+        self._logged = 0      # jumlah catatan yang sudah ditulis ke log
+        _local.recorder = self
+        _local.stack = []
+
+    @contextmanager
+    def stage(self, name, rows=None, cached=False):
+        stack = _local.stack
+        record = {
+            "stage": " / ".join([r["stage"] for r in stack[-1:]] + [name]),
+            "depth": len(stack),
+            "rows": rows,
+            # Tahap ber-cache dianggap "hit" sampai fungsi yang dibungkus computes() benar-benar jalan
+            "cache": "hit" if cached else None,
+        }
+        # Dicatat saat tahap dimulai agar urutan tabel = urutan eksekusi
+        self.records.append(record)
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            stack.pop()
+            if not stack:
+                self.flush()
+
+    def table(self):
+        # Ringkasan per tahap (tahap yang dipanggil berulang dijumlahkan)
+        if not self.records:
+            return pd.DataFrame(columns=["Tahap", "Panggilan", "Detik", "Baris", "Cache"])
+        df = pd.DataFrame(self.records)
+        order = df.drop_duplicates("stage").sort_index()["stage"]
+        grouped = df.groupby("stage", sort=False).agg(
+            Panggilan=("stage", "size"),
+            Detik=("seconds", "sum"),
+            Baris=("rows", lambda r: r.sum(min_count=1)),
+            Cache=("cache", lambda c: "miss" if (c == "miss").any() else ("hit" if c.notna().any() else "")),
+        )
+        grouped = grouped.loc[order].reset_index().rename(columns={"stage": "Tahap"})
+        grouped["Detik"] = grouped["Detik"].round(4)
+        grouped["Baris"] = grouped["Baris"].astype("Int64")
+        return grouped
+
+    def total_seconds(self):
+        return sum(r["seconds"] for r in self.records if r["depth"] == 0)
+
+    def flush(self, max_bytes=LOG_MAX_BYTES):
+        # Tambahkan tahap yang belum ditulis ke log JSONL (catatan tetap disimpan untuk tabel debug)
+        pending = self.records[self._logged:]
+        if self.log_path is None or not pending:
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if self.log_path.stat().st_size >= max_bytes:
+                os.replace(self.log_path, self.log_path.with_name(self.log_path.name + ".1"))
+        except FileNotFoundError:
+            pass
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            for record in pending:
+                f.write(json.dumps({
+                    "ts": self.started,
+                    "page": self.page,
+                    "run": self.run_id,
+                    "stage": record["stage"],
+                    "seconds": round(record["seconds"], 6),
+                    "rows": None if record["rows"] is None else int(record["rows"]),
+                    "cache": record["cache"],
+                }) + "\n")
+        self._logged = len(self.records)
+
+
+# =====================
+# API TAHAP
+# =====================
+@contextmanager
+def stage(name, rows=None, cached=False):
+    """Ukur satu tahap bernama; `rows` dan `cache` bisa diisi lewat dict yang di-yield."""
+    recorder = getattr(_local, "recorder", None)
+    if recorder is None:
+        yield {}
+        return
+    with recorder.stage(name, rows=rows, cached=cached) as record:
+        yield record
+
+
+def timed(name):
+    # Dekorator: setiap panggilan fungsi dicatat sebagai tahap `name`
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def mark_cache(status):
+    # Set status cache ("hit"/"miss") pada tahap aktif terdalam
+    stack = getattr(_local, "stack", None)
+    if stack:
+        stack[-1]["cache"] = status
+
+
+def computes(fn):
+    """Dekorator untuk isi fungsi ber-cache (di bawah @st.cache_*).
+
+    Isi fungsi hanya dijalankan saat cache miss, jadi tahap aktif ditandai "miss".
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        mark_cache("miss")
+        return fn(*args, **kwargs)
+    return wrapper
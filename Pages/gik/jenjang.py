@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+JENJANG_LEVELS = ["S1", "S2", "Vokasi", "Lainnya"]
+
+
+# =====================
+# VERSI PER BARIS (REFERENSI)
+# =====================
+def derive_jenjang(prodi, fakultas=None):
+    if not isinstance(prodi, str):
+        prodi = ''
+    p = prodi.lower()
+    if p.startswith('s1') or 'sarjana' in p:
+        return 'S1'
+    if p.startswith('s2') or 'magister' in p or 'master' in p:
+        return 'S2'
+    if p.startswith('d4') or 'vokasi' in (fakultas or '').lower():
+        return 'Vokasi'
+    return 'Lainnya'
+
+
+# =====================
+# VERSI VEKTOR
+# =====================
+def classify_jenjang(prodi, fakultas=None):
+    # Aturan sama dengan derive_jenjang, dievaluasi sekaligus untuk seluruh kolom
+    p = prodi.str.lower().fillna('')
+    if fakultas is None:
+        f = pd.Series('', index=prodi.index)
+    else:
+        f = fakultas.str.lower().fillna('')
+
+    values = np.select(
+        [
+            p.str.startswith('s1') | p.str.contains('sarjana', regex=False),
+            p.str.startswith('s2') | p.str.contains('magister', regex=False) | p.str.contains('master', regex=False),
+            p.str.startswith('d4') | f.str.contains('vokasi', regex=False),
+        ],
+        JENJANG_LEVELS[:3],
+        default='Lainnya'
+    )
+    return pd.Series(pd.Categorical(values, categories=JENJANG_LEVELS), index=prodi.index)
@@ -0,0 +1,28 @@
+# =====================
+# KAMUS KATA KUNCI
+# =====================
+# Tema aspirasi (halaman Analisis Kualitatif), dicocokkan per token utuh
+THEME_MAP = {
+    "Kemitraan & Karier": [
+        "mitra", "perusahaan", "industri", "magang",
+        "kerja", "lapangan", "kunjungan", "umkm"
+    ],
+    "Metode Pembelajaran": [
+        "praktik", "diskusi", "interaktif", "tugas",
+        "langsung", "praktek", "seru", "materi"
+    ],
+    "Manajemen & Fasilitas": [
+        "jadwal", "waktu", "durasi", "sesi",
+        "bentrok", "malam", "pagi", "link", "zoom", "fasilitas"
+    ]
+}
+
+# Alasan kepuasan (halaman Analisis Bauran), dicocokkan sebagai substring.
+# Tiga alasan pertama = pendorong kepuasan, sisanya = kendala.
+REASON_MAP = {
+    "Akses perusahaan mitra & peluang magang": ["perusahaan", "mitra", "magang"],
+    "Pengalaman kunjungan industri yang aplikatif": ["kunjungan", "industri", "lapangan"],
+    "Pembelajaran praktis & relevan": ["praktik", "langsung", "digital"],
+    "Kendala jadwal dan durasi kegiatan": ["jadwal", "waktu", "durasi"],
+    "Keterbatasan pendampingan lanjutan": ["mentor", "evaluasi", "pendamping"]
+}
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from gik.instrument import timed
+
+# =====================
+# KOSAKATA JAWABAN (URUTAN TAMPIL)
+# =====================
+ANSWER_ORDER = [
+    "Sangat puas", "Puas", "Netral", "Tidak puas", "Sangat tidak puas",
+    "Sangat berdampak", "Berdampak",
+    "Cukup/ideal", "Terlalu singkat", "Terlalu panjang",
+    "Sangat direkomendasikan", "Direkomendasikan", "Tidak direkomendasikan",
+    "Ya", "Tidak"
+]
+
+
+def build_vocabulary(df, columns):
+    # Kosakata bersama: urutan baku + jawaban lain yang muncul (urut kemunculan pertama)
+    seen = pd.unique(pd.concat([df[c] for c in columns], ignore_index=True).dropna().astype(str))
+    known = set(ANSWER_ORDER)
+    return ANSWER_ORDER + [v for v in seen if v not in known]
+
+
+def encode(df, columns, vocabulary):
+    # Matriks kode int8/int16 (baris x indikator), -1 = tidak menjawab
+    dtype = np.int8 if len(vocabulary) < 127 else np.int16
+    codes = np.empty((len(df), len(columns)), dtype=dtype)
+    for j, col in enumerate(columns):
+        codes[:, j] = pd.Categorical(df[col].astype("string"), categories=vocabulary).codes
+    return codes
+
+
+# =====================
+# DISTRIBUSI SEMUA INDIKATOR
+# =====================
+@timed("likert.distribusi")
+def compute_distributions(df, columns):
+    """Hitung distribusi jawaban semua indikator Likert dalam satu lintasan.
+
+    Mengembalikan dict {kolom: {"table", "dominant", "dominant_pct", "is_yes_no"}}.
+    `table` berisi Jawaban/Jumlah/Persentase dalam urutan ANSWER_ORDER. Jika ada
+    jumlah yang seri, jawaban dominan = yang paling awal muncul di data
+    (sama dengan value_counts().idxmax()).
+    """
+    columns = [c for c in columns if c in df.columns]
+    vocabulary = build_vocabulary(df, columns)
+    n_vocab = len(vocabulary)
+    codes = encode(df, columns, vocabulary).astype(np.int64)
+
+    valid = codes >= 0
+    flat = (codes + np.arange(len(columns)) * n_vocab)[valid]
+    counts = np.bincount(flat, minlength=len(columns) * n_vocab).reshape(len(columns), n_vocab)
+
+    # Posisi kemunculan pertama tiap jawaban per indikator (untuk memecah seri)
+    first = np.full(len(columns) * n_vocab, len(df), dtype=np.int64)
+    rows = np.broadcast_to(np.arange(len(df))[:, None], codes.shape)[valid]
+    np.minimum.at(first, flat, rows)
+    first = first.reshape(len(columns), n_vocab)
+
+    labels = np.array(vocabulary, dtype=object)
+    result = {}
+    for j, col in enumerate(columns):
+        present = np.flatnonzero(counts[j])
+        total = counts[j].sum()
+        if total == 0:
+            result[col] = None
+            continue
+
+        top = present[counts[j, present] == counts[j, present].max()]
+        dominant = top[np.argmin(first[j, top])]
+
+        table = pd.DataFrame({
+            "Jawaban": labels[present],
+            "Jumlah": counts[j, present],
+        })
+        table["Persentase"] = (table["Jumlah"] / total * 100).round(1)
+
+        result[col] = {
+            "table": table,
+            "dominant": vocabulary[dominant],
+            "dominant_pct": round(counts[j, dominant] / total * 100, 1),
+            "is_yes_no": set(table["Jawaban"]).issubset({"Ya", "Tidak"}),
+        }
+    return result
@@ -0,0 +1,89 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from gik.instrument import timed
+
+
+# =====================
+# AHO-CORASICK MATCHER
+# =====================
+class KeywordMatcher:
+    """Automaton Aho-Corasick yang dikompilasi sekali dari kamus kata kunci.
+
+    `groups` adalah dict {nama_grup: [kata kunci, ...]} (mis. THEME_MAP dan
+    REASON_MAP). Satu kata kunci boleh muncul di beberapa grup. Satu kali
+    lintasan per teks menghasilkan jumlah kemunculan setiap kata kunci.
+    """
+
+    def __init__(self, groups):
+        self.groups = list(groups)
+        self.keywords = list(dict.fromkeys(k for kws in groups.values() for k in kws))
+        kw_id = {k: i for i, k in enumerate(self.keywords)}
+
+        # Matriks keanggotaan kata kunci x grup untuk agregasi skor per grup
+        self.membership = np.zeros((len(self.keywords), len(self.groups)), dtype=np.int32)
+        for g, kws in enumerate(groups.values()):
+            for k in kws:
+                self.membership[kw_id[k], g] = 1
+
+        self._alphabet = frozenset("".join(self.keywords))
+        self._build()
+
+    def _build(self):
+        goto, fail, out = [{}], [0], [()]
+        for i, kw in enumerate(self.keywords):
+            node = 0
+            for ch in kw:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    out.append(())
+                node = nxt
+            out[node] += (i,)
+
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] += out[fail[nxt]]
+
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def scan(self, text):
+        # Kembalikan array jumlah kemunculan per kata kunci untuk satu teks
+        counts = np.zeros(len(self.keywords), dtype=np.int32)
+        goto, fail, out, alphabet = self._goto, self._fail, self._out, self._alphabet
+        node = 0
+        for ch in text:
+            if ch not in alphabet:
+                node = 0
+                continue
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for k in out[node]:
+                counts[k] += 1
+        return counts
+
+    @timed("keyword_scan")
+    def count_matrix(self, texts):
+        # Matriks responden x kata kunci; teks identik hanya dipindai sekali
+        codes, uniques = pd.factorize(pd.Series(texts, dtype=object).fillna(""))
+        matrix = np.zeros((len(uniques), len(self.keywords)), dtype=np.int32)
+        for j, text in enumerate(uniques):
+            matrix[j] = self.scan(text)
+        return matrix[codes] if len(codes) else matrix[:0]
+
+    def group_matrix(self, counts):
+        # Jumlah kemunculan per grup dari matriks/vektor per kata kunci
+        return counts @ self.membership
@@ -0,0 +1,120 @@
+import heapq
+import itertools
+
+# Kapasitas sketch per (pertanyaan, segmen, n): hitungan tepat selama frasa unik <= kapasitas
+DEFAULT_CAPACITY = 2_000
+NGRAM_SIZES = (1, 2, 3)
+
+
+# =====================
+# SPACE-SAVING SKETCH
+# =====================
+class SpaceSaving:
+    """Hitungan heavy-hitter dengan memori tetap (algoritma Space-Saving, berbobot).
+
+    Menyimpan paling banyak `capacity` item. Saat penuh, item dengan hitungan
+    terkecil diganti item baru yang mewarisi hitungan tersebut (dicatat sebagai
+    `error`), sehingga hitungan tiap item adalah batas atas dan item dengan
+    frekuensi > total/capacity dijamin tetap tersimpan.
+
+    Selama belum penuh cukup dict biasa; min-heap baru dibangun pada eviction
+    pertama, setelah itu hanya item yang hitungannya berubah yang di-push.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        self._seen = {}   # urutan kemunculan pertama, untuk memecah hitungan seri
+        self._heap = None  # (count, seq, item); entri basi dilewati saat eviction
+        self._seq = itertools.count()
+
+    def add(self, item, weight=1):
+        self.total += weight
+        if item in self.counts:
+            self.counts[item] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = weight
+            self.errors[item] = 0
+            self._seen[item] = next(self._seq)
+            return
+        else:
+            floor = self._evict()
+            self.counts[item] = floor + weight
+            self.errors[item] = floor
+            self._seen[item] = next(self._seq)
+        if self._heap is None:
+            return
+        heapq.heappush(self._heap, (self.counts[item], self._seen[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(c, self._seen[i], i) for i, c in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def _evict(self):
+        # Buang item dengan hitungan terkecil, kembalikan hitungannya
+        if self._heap is None:
+            self._rebuild_heap()
+        while True:
+            count, seq, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count and self._seen[item] == seq:
+                del self.counts[item], self.errors[item], self._seen[item]
+                return count
+
+    def top(self, k):
+        # [(item, count)] terurut hitungan menurun, seri mengikuti kemunculan pertama
+        items = sorted(self.counts, key=lambda i: (-self.counts[i], self._seen[i]))
+        return [(i, self.counts[i]) for i in items[:k]]
+
+    def __len__(self):
+        return len(self.counts)
+
+
+# =====================
+# N-GRAM STREAM
+# =====================
+def iter_ngrams(tokens, n):
+    return (" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+class PhraseCounter:
+    """Top-k frasa 1-3 kata per kunci (mis. (pertanyaan, segmen)) dari aliran respons.
+
+    Aliran berisi teks unik beserta bobotnya (jumlah respons identik), jadi tiap
+    teks ditokenisasi sekali dan setiap n-gram ditambahkan sekali dengan bobot
+    tersebut. Memori sketch tetap: jumlah kunci x len(sizes) x capacity.
+    """
+
+    def __init__(self, tokenizer, sizes=NGRAM_SIZES, capacity=DEFAULT_CAPACITY):
+        self.tokenizer = tokenizer
+        self.sizes = tuple(sizes)
+        self.capacity = capacity
+        self.sketches = {}
+        self.responses = {}
+
+    def add(self, keys, text, weight=1):
+        # `weight` respons identik; token diambil dari memo LRU tokenizer (teks bisa muncul di beberapa kunci)
+        tokens = self.tokenizer.tokenize(text)
+        for n in self.sizes:
+            grams = list(iter_ngrams(tokens, n))
+            for key in keys:
+                sketch = self.sketches.get((key, n))
+                if sketch is None:
+                    sketch = self.sketches[(key, n)] = SpaceSaving(self.capacity)
+                for gram in grams:
+                    sketch.add(gram, weight)
+        for key in keys:
+            self.responses[key] = self.responses.get(key, 0) + weight
+
+    def consume(self, stream):
+        # stream: iterable (daftar kunci, teks, bobot), mis. generator
+        for keys, text, weight in stream:
+            self.add(keys, text, weight)
+        return self
+
+    def top(self, key, n=2, k=10):
+        sketch = self.sketches.get((key, n))
+        return sketch.top(k) if sketch is not None else []
@@ -0,0 +1,90 @@
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from gik.dedup import CommentGroups
+from gik.instrument import stage
+from gik.text import Tokenizer
+
+# Jumlah proses worker (GIK_WORKERS=1 memaksa jalur serial)
+WORKERS = int(os.environ.get("GIK_WORKERS") or os.cpu_count() or 1)
+# Di bawah jumlah teks unik ini biaya start proses lebih besar dari hasilnya
+MIN_PARALLEL_TEXTS = 20_000
+CHUNK_SIZE = 5_000
+
+# Tokenizer milik proses worker (dibuat sekali oleh initializer pool)
+_worker_tokenizer = None
+
+
+# =====================
+# HITUNG N-GRAM PER POTONGAN
+# =====================
+def count_ngrams(token_lists, weights):
+    """Counter unigram & bigram dari token per teks, dikali bobot (jumlah kemunculan teks).
+
+    Bigram = dua token bersih berurutan dalam satu respons, digabung dengan spasi.
+    Urutan kunci = urutan kemunculan pertama, sama seperti Counter dari token berurutan.
+    """
+    unigrams, bigrams = Counter(), Counter()
+    for tokens, weight in zip(token_lists, weights):
+        for token in tokens:
+            unigrams[token] += weight
+        for pair in zip(tokens, tokens[1:]):
+            bigrams[" ".join(pair)] += weight
+    return unigrams, bigrams
+
+
+def _init_worker(stop_words, min_len):
+    global _worker_tokenizer
+    _worker_tokenizer = Tokenizer(stop_words, min_len)
+
+
+def _count_chunk(chunk):
+    texts, weights = chunk
+    tokens = _worker_tokenizer.tokenize_series(pd.Series(texts, dtype=object))
+    return count_ngrams(tokens, weights)
+
+
+def _chunks(texts, weights, size):
+    for start in range(0, len(texts), size):
+        yield texts[start:start + size], weights[start:start + size]
+
+
+# =====================
+# API
+# =====================
+def ngram_counts(texts, tokenizer=None, workers=None, chunk_size=CHUNK_SIZE, min_parallel=MIN_PARALLEL_TEXTS):
+    """Frekuensi unigram & bigram untuk Series teks, serial atau lewat process pool.
+
+    Teks yang identik setelah normalisasi dihitung sekali (berbobot). Teks unik
+    dibagi per potongan ke worker; tiap worker mengembalikan Counter parsial
+    yang digabung berurutan, sehingga hasil (termasuk urutan seri most_common)
+    sama persis dengan jalur serial dan daftar token lengkap tidak pernah dibentuk.
+    """
+    tokenizer = tokenizer or Tokenizer()
+    workers = WORKERS if workers is None else workers
+    # Grup teks ter-normalisasi (token identik) dengan bobot jumlah baris, lihat gik/dedup.py
+    groups = CommentGroups(texts)
+    values = groups.texts
+    weights = groups.weights.tolist()
+
+    if workers <= 1 or len(values) < min_parallel:
+        with stage("ngram.serial", rows=len(values)):
+            return count_ngrams(tokenizer.tokenize_series(pd.Series(values, dtype=object)), weights)
+
+    unigrams, bigrams = Counter(), Counter()
+    with stage("ngram.parallel", rows=len(values)):
+        # forkserver: aman dipakai dari server Streamlit yang multi-thread
+        context = multiprocessing.get_context("forkserver")
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context,
+            initializer=_init_worker, initargs=(tokenizer.stop_words, tokenizer.min_len)
+        ) as pool:
+            # map() mengembalikan hasil sesuai urutan potongan -> reduce berurutan
+            for part_uni, part_bi in pool.map(_count_chunk, _chunks(values, weights, chunk_size)):
+                unigrams.update(part_uni)
+                bigrams.update(part_bi)
+    return unigrams, bigrams
@@ -0,0 +1,71 @@
+import hashlib
+import io
+from collections import OrderedDict
+from threading import Lock
+
+from gik.instrument import mark_cache, stage
+
+WORDCLOUD_OPTIONS = dict(
+    width=1000,
+    height=600,
+    background_color="white",
+    colormap="viridis",
+    max_words=100,
+    random_state=42,  # Layout deterministik agar hasil cache konsisten
+)
+
+
+# =====================
+# WORD CLOUD RENDERER
+# =====================
+class WordCloudRenderer:
+    """Render word cloud dari tabel frekuensi ke PNG, dengan cache LRU terbatas.
+
+    Gambar langsung diambil dari WordCloud.to_image() sehingga tidak ada
+    figure matplotlib yang dibuat (dan tertinggal) di setiap rerun.
+    """
+
+    def __init__(self, max_entries=16, **options):
+        self.options = {**WORDCLOUD_OPTIONS, **options}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def frequencies_key(frequencies):
+        # Urutan item ikut di-hash karena memengaruhi kata yang lolos max_words saat seri
+        h = hashlib.sha1()
+        for word, count in frequencies.items():
+            h.update(f"{word}\t{count}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def render(self, frequencies):
+        with stage("wordcloud"):
+            return self._render(frequencies)
+
+    def _render(self, frequencies):
+        key = self.frequencies_key(frequencies)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                mark_cache("hit")
+                return self._cache[key]
+
+        mark_cache("miss")
+        # Import di sini: wordcloud (dan matplotlib di baliknya) hanya dimuat saat benar-benar render
+        from wordcloud import WordCloud
+
+        wc = WordCloud(**self.options).generate_from_frequencies(frequencies)
+        buf = io.BytesIO()
+        wc.to_image().save(buf, format="PNG")
+        png = buf.getvalue()
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = png
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return png
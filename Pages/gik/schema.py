@@ -0,0 +1,118 @@
+import pandas as pd
+
+from gik.instrument import timed
+
+# =====================
+# JENIS KOLOM
+# =====================
+# Skema = dict {kolom: jenis}. Jenis yang dikenal:
+#   CATEGORY       -> categorical (kode int8 + kategori terurut alfabet)
+#   [v1, v2, ...]  -> categorical dengan urutan kategori tetap; nilai lain yang
+#                     muncul ditambahkan di belakang agar tidak hilang
+#   TEXT           -> teks bebas, disimpan sebagai Arrow string (string[pyarrow])
+#   DATETIME       -> datetime64[ns] (int64 nanodetik)
+CATEGORY = "category"
+TEXT = "text"
+DATETIME = "datetime"
+
+
+def _to_category(series, categories=None):
+    if categories is None:
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series
+        return series.astype("category")
+    known = set(categories)
+    extra = [v for v in pd.unique(series.dropna().astype(str)) if v not in known]
+    return pd.Series(
+        pd.Categorical(series.astype(object), categories=list(categories) + extra),
+        index=series.index, name=series.name
+    )
+
+
+def apply_schema(df, schema, default=None):
+    """Ubah tipe kolom sesuai skema; kolom di luar skema memakai `default` (None = biarkan)."""
+    for col in df.columns:
+        kind = schema.get(col, default)
+        if kind is None:
+            continue
+        if kind == TEXT:
+            df[col] = df[col].astype("string[pyarrow]")
+        elif kind == DATETIME:
+            df[col] = pd.to_datetime(df[col])
+        elif kind == CATEGORY:
+            df[col] = _to_category(df[col])
+        else:
+            df[col] = _to_category(df[col], kind)
+    return df
+
+
+def write_arrow(df, path):
+    # Arrow IPC (Feather v2) tanpa kompresi agar bisa di-memory-map apa adanya saat dibaca
+    df.to_feather(path, compression="uncompressed")
+
+
+@timed("read_arrow")
+def read_arrow(path):
+    """Baca file Arrow IPC lewat memory map (read-only).
+
+    Buffer kolom teks (Arrow string) menunjuk langsung ke page cache OS, jadi
+    semua sesi & proses yang membaca file yang sama berbagi memori yang sama.
+    `split_blocks` mencegah pandas menggabungkan kolom ke blok baru (salinan).
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    # Skema hanya menyimpan "string"; paksa kembali ke Arrow string saat dibaca
+    with pd.option_context("mode.string_storage", "pyarrow"):
+        return table.to_pandas(split_blocks=True)
+
+
+# =====================
+# HITUNG NILAI
+# =====================
+@timed("value_counts")
+def value_counts(series):
+    """Seperti `series.value_counts()`, tetapi jumlah yang seri diurutkan menurut kemunculan pertama.
+
+    `value_counts()` pandas memecah seri menurut urutan hash; di sini sort stabil
+    atas urutan kemunculan, sama dengan CountCube & SqlTable. Untuk categorical
+    hanya kategori yang muncul yang dihitung (bukan urutan kategori).
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        # sort=False -> urutan kemunculan pertama
+        return series.value_counts(sort=False).sort_values(ascending=False, kind="stable")
+    codes = pd.Series(series.cat.codes.to_numpy())
+    counts = codes[codes >= 0].value_counts(sort=False).sort_values(ascending=False, kind="stable")
+    counts.index = pd.Index(series.cat.categories.take(counts.index.to_numpy()), dtype=object, name=series.name)
+    return counts
+
+
+# =====================
+# LAPORAN MEMORI
+# =====================
+def memory_report(before, after):
+    # Pemakaian memori per kolom (byte, deep=True) sebelum & sesudah skema diterapkan
+    report = pd.DataFrame({
+        "dtype_sebelum": before.dtypes.astype(str),
+        "byte_sebelum": before.memory_usage(deep=True, index=False),
+        "dtype_sesudah": after.dtypes.astype(str),
+        "byte_sesudah": after.memory_usage(deep=True, index=False),
+    })
+    report.loc["TOTAL"] = ["", report["byte_sebelum"].sum(), "", report["byte_sesudah"].sum()]
+    report["rasio"] = (report["byte_sesudah"] / report["byte_sebelum"]).round(2)
+    return report
+
+
+if __name__ == "__main__":
+    # python -m gik.schema  (dari folder Pages) -> laporan memori tiap dataset
+    from gik.datasets import DATASETS
+    from gik.ingest import DATA_DIR
+
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        for name, (prepare, schema, default) in DATASETS.items():
+            before = prepare(pd.read_csv(DATA_DIR / f"{name}.csv"))
+            after = apply_schema(before.copy(), schema, default)
+            report = memory_report(before, after)
+            report.index = [str(c)[:40] for c in report.index]
+            print(f"\n== {name} ({len(before)} baris) ==")
+            print(report)
@@ -0,0 +1,43 @@
+import numpy as np
+
+# =====================
+# SKOR KEPUASAN
+# =====================
+SCORE_MAP = {"Sangat puas": 5, "Puas": 4, "Netral": 3, "Tidak puas": 2, "Sangat tidak puas": 1}
+SATISFACTION_COLUMNS = ["puas_mentor", "puas_metode", "puas_materi", "puas_fasilitas", "puas_tim"]
+HIGH_THRESHOLD = 4.2
+
+
+class SatisfactionScores:
+    """Skor kepuasan per responden, dihitung sekali per versi dataset.
+
+    `matrix` berisi skor int8 (baris x indikator, 0 = tidak menjawab);
+    `avg_kepuasan` rata-rata float32 per responden (NaN jika tidak menjawab
+    sama sekali). DataFrame sumber tidak diubah maupun disalin.
+    """
+
+    def __init__(self, df, columns=SATISFACTION_COLUMNS, score_map=SCORE_MAP, threshold=HIGH_THRESHOLD):
+        self.columns = list(columns)
+        self.matrix = np.zeros((len(df), len(self.columns)), dtype=np.int8)
+        for j, col in enumerate(self.columns):
+            # astype float: kolom Likert bisa bertipe categorical (lihat gik/schema.py)
+            self.matrix[:, j] = df[col].map(score_map).astype("float64").fillna(0).to_numpy(dtype=np.int8)
+
+        self._sums = self.matrix.sum(axis=1, dtype=np.int16)
+        self._answered = np.count_nonzero(self.matrix, axis=1).astype(np.int8)
+
+        avg = self._row_mean(slice(None))
+        self.avg_kepuasan = avg.astype(np.float32)
+        # NaN tidak masuk segmen mana pun (sama seperti perbandingan di pandas)
+        self.high_rows = np.flatnonzero(avg >= threshold)
+        self.low_rows = np.flatnonzero(avg < threshold)
+
+    def _row_mean(self, rows):
+        # Rata-rata float64 dari jumlah & cacah int, setara mean(axis=1, skipna=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._sums[rows] / self._answered[rows]
+
+    def segment_mean(self, rows):
+        # Rata-rata skor kepuasan satu segmen (NaN jika segmen kosong)
+        values = self._row_mean(rows)
+        return values.mean() if len(values) else np.nan
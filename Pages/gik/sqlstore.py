@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gik.ingest import CACHE_DIR, _read_meta, _write_atomic
+from gik.instrument import timed
+from gik.timeline import NS_PER_HOUR, HourlyCounts
+
+# Mesin filter & agregasi halaman pendaftar/peserta: "pandas" (default) atau "sqlite"
+BACKEND = os.environ.get("GIK_BACKEND", "pandas").strip().lower()
+USE_SQL = BACKEND == "sqlite"
+
+TABLE = "data"
+HOUR = "Jam"
+FORMAT = 2                # naikkan jika struktur tabel berubah -> DB dibangun ulang
+MMAP_SIZE = 1 << 30       # batas memory map file DB per koneksi (byte)
+
+
+def quote(name):
+    # Nama kolom survei berisi spasi/tanda tanya -> identifier SQL ber-kutip
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+# =====================
+# TABEL SQLITE
+# =====================
+class SqlTable:
+    """Tabel hasil prepare di file SQLite lokal; filter & agregasi lewat query berparameter.
+
+    - Baris dengan kombinasi (jam, kolom filter) yang sama disimpan sekali
+      sebagai sel: `jumlah` baris dan `pertama` (posisi baris pertama), seperti
+      CountCube. MIN(pertama) = kemunculan pertama, jadi seri di `counts`
+      diurutkan menurut kemunculan pertama, sama dengan CountCube &
+      schema.value_counts.
+    - Setiap kolom filter punya indeks (diikuti nomor jam bila ada kolom waktu),
+      sehingga WHERE dijawab lewat indeks dan hanya tabel agregat kecil yang
+      dikembalikan ke Python.
+    - `select`/`counts`/`total` sama dengan CountCube, jadi fungsi di
+      gik/analytics dipakai apa adanya.
+    """
+
+    def __init__(self, path, columns, time_column=None):
+        self.path = Path(path)
+        self.columns = list(columns)
+        self._local = threading.local()
+
+    @classmethod
+    def open(cls, name, df, columns, time_column=None):
+        """Buka (atau bangun sekali) DB untuk dataset `name` dari DataFrame hasil load_prepared.
+
+        Nama file mengikuti cache Arrow (hash versi prepare + isi CSV), jadi DB
+        ikut dibangun ulang saat cache berubah dan file lama dibersihkan bersamanya.
+        """
+        meta = _read_meta(CACHE_DIR / f"{name}.meta.json")
+        stem = Path(meta.get("file", f"{name}.arrow")).stem
+        path = CACHE_DIR / f"{stem}.v{FORMAT}.sqlite"
+        if not path.exists():
+            _write_atomic(path, lambda tmp: cls._build(tmp, df, columns, time_column))
+            # DB format lama untuk cache yang sama
+            for old in CACHE_DIR.glob(f"{stem}*.sqlite"):
+                if old != path:
+                    try:
+                        old.unlink()
+                    except OSError:
+                        pass
+        return cls(path, columns, time_column)
+
+    @staticmethod
+    @timed("sql.build")
+    def _build(path, df, columns, time_column):
+        data = {}
+        if time_column is not None:
+            ts = df[time_column].to_numpy(dtype="datetime64[ns]").view(np.int64)
+            data[HOUR] = ts // NS_PER_HOUR
+        for col in columns:
+            values = df[col].astype(object)
+            data[col] = values.where(values.notna(), None).to_numpy()
+        keys = list(data)
+        cells = (
+            pd.DataFrame(data).assign(_row=np.arange(len(df)))
+            .groupby(keys, sort=False, dropna=False)
+            .agg(jumlah=("_row", "size"), pertama=("_row", "min"))
+            .reset_index()
+        )
+
+        with closing(sqlite3.connect(path)) as con:
+            cells.to_sql(TABLE, con, index=False)
+            suffix = f", {quote(HOUR)}" if time_column is not None else ""
+            for i, col in enumerate(columns):
+                con.execute(f"CREATE INDEX idx_{i} ON {TABLE} ({quote(col)}{suffix})")
+            if time_column is not None:
+                con.execute(f"CREATE INDEX idx_jam ON {TABLE} ({quote(HOUR)})")
+            # Statistik indeks untuk query planner
+            con.execute("ANALYZE")
+            con.commit()
+
+    def _connection(self):
+        # Satu koneksi read-only per thread (tiap sesi Streamlit punya thread sendiri), page cache dipakai ulang
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(f"{self.path.as_uri()}?mode=ro", uri=True)
+            con.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            self._local.con = con
+        return con
+
+    def _query(self, sql, params=()):
+        return self._connection().execute(sql, params).fetchall()
+
+    def _where(self, selections, between=None, extra=()):
+        # selections: {kolom: nilai | list nilai}; between = (jam awal, jam akhir) inklusif
+        clauses, params = list(extra), []
+        for col, selection in selections.items():
+            if col not in self.columns:
+                raise KeyError(col)
+            if isinstance(selection, (list, tuple, set, frozenset)):
+                selection = list(selection)
+                clauses.append(f"{quote(col)} IN ({', '.join('?' * len(selection))})")
+                params.extend(selection)
+            else:
+                clauses.append(f"{quote(col)} = ?")
+                params.append(selection)
+        if between is not None:
+            clauses.append(f"{quote(HOUR)} BETWEEN ? AND ?")
+            params.extend(int(b) for b in between)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @timed("sql.select")
+    def select(self, selections, between=None):
+        # Jumlah baris per jam yang lolos filter (kolom Jam & count, seperti sel CountCube)
+        where, params = self._where(selections, between)
+        rows = self._query(
+            f"SELECT {quote(HOUR)}, SUM(jumlah) FROM {TABLE}{where} GROUP BY {quote(HOUR)} ORDER BY {quote(HOUR)}",
+            params
+        )
+        return pd.DataFrame(rows, columns=[HOUR, "count"], dtype=np.int64)
+
+    @timed("sql.total")
+    def total(self, selections, between=None):
+        where, params = self._where(selections, between)
+        return self._query(f"SELECT COALESCE(SUM(jumlah), 0) FROM {TABLE}{where}", params)[0][0]
+
+    @timed("sql.counts")
+    def counts(self, dim, selections, between=None):
+        # Seperti CountCube.counts: urut jumlah menurun, seri = kemunculan pertama (sort stabil)
+        where, params = self._where(selections, between, extra=[f"{quote(dim)} IS NOT NULL"])
+        rows = self._query(
+            f"SELECT {quote(dim)}, SUM(jumlah) FROM {TABLE}{where} GROUP BY {quote(dim)} ORDER BY MIN(pertama)",
+            params
+        )
+        counts = pd.Series(
+            [c for _, c in rows], index=pd.Index([v for v, _ in rows], dtype=object, name=dim),
+            name="count", dtype=np.int64
+        )
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def options(self, col):
+        # Nilai unik terurut (urutan biner = sorted() Python), dibaca dari indeks kolom
+        return [v for (v,) in self._query(
+            f"SELECT DISTINCT {quote(col)} FROM {TABLE} WHERE {quote(col)} IS NOT NULL ORDER BY {quote(col)}"
+        )]
+
+    def timeline(self):
+        # Jumlah per jam seluruh tabel (pengganti Timeline: deret tren, hari & jam tersibuk)
+        cells = self.select({})
+        if cells.empty:
+            return HourlyCounts(0, [])
+        return HourlyCounts.from_hours(cells[HOUR], weights=cells["count"])
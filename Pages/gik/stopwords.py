@@ -0,0 +1,62 @@
+import argparse
+from pathlib import Path
+
+# Daftar stopword dikirim bersama repo (tanpa lookup/unduh NLTK saat startup).
+# Baris "# version:" dinaikkan setiap kali isi daftar berubah.
+STOPWORDS_PATH = Path(__file__).resolve().parent / "data" / "stopwords_id.txt"
+
+# Kata yang terlalu umum di konteks survei program ini
+CUSTOM_STOPWORDS = {
+    "program", "giknowledge", "building", "kelas", "materi", "mentor",
+    "peserta", "kegiatan", "gik", "nan", "pertanyaan", "relevan", "pilih", "jawaban"
+}
+
+
+def read_stopwords(path=STOPWORDS_PATH):
+    """Baca file stopword: satu kata per baris, baris `#` = komentar/metadata."""
+    words = set()
+    meta = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("#"):
+                key, sep, value = line.lstrip("# ").partition(":")
+                if sep:
+                    meta[key.strip()] = value.strip()
+            elif line:
+                words.add(line)
+    return frozenset(words), meta
+
+
+def load_stopwords(path=STOPWORDS_PATH):
+    return read_stopwords(path)[0]
+
+
+def export_from_nltk(path=STOPWORDS_PATH, version=None):
+    # Bangun ulang file dari korpus NLTK 'indonesian' + CUSTOM_STOPWORDS (butuh korpus terpasang)
+    from nltk.corpus import stopwords
+
+    if version is None:
+        version = int(read_stopwords(path)[1].get("version", 0)) + 1 if path.exists() else 1
+    nltk_words = set(stopwords.words("indonesian"))
+    lines = [
+        f"# version: {version}",
+        "# source: nltk stopwords corpus 'indonesian' + gik.stopwords.CUSTOM_STOPWORDS",
+        "# regenerate: python -m gik.stopwords --export",
+        *sorted(nltk_words | CUSTOM_STOPWORDS),
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+if __name__ == "__main__":
+    # python -m gik.stopwords [--export]  (dari folder Pages)
+    parser = argparse.ArgumentParser(description="Daftar stopword bahasa Indonesia GIKnowledge")
+    parser.add_argument("--export", action="store_true", help="tulis ulang file dari korpus NLTK")
+    args = parser.parse_args()
+
+    if args.export:
+        print(export_from_nltk())
+    words, meta = read_stopwords()
+    print(f"{STOPWORDS_PATH}: versi {meta.get('version')}, {len(words)} kata")
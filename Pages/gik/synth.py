@@ -0,0 +1,187 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gik.datasets import EVALUASI_COLUMNS, EVALUASI_TEXT_COLUMNS
+from gik.ingest import ROOT_DIR
+
+# CSV sampel di repo menjadi sumber header & distribusi nilai
+SAMPLE_DIR = ROOT_DIR / "data"
+DATASET_NAMES = ["data_evaluasi", "data_pendaftar", "data_peserta"]
+
+# =====================
+# BANK KALIMAT (JAWABAN TERBUKA)
+# =====================
+# Kalimat = awalan + isi + penutup (dipilih acak); `short` = jawaban singkat khas survei
+TEXT_BANKS = {
+    "manfaat": {
+        "parts": [
+            ["Menambah ", "Mendapatkan ", "Memperluas ", "Meningkatkan ", "Saya mendapatkan ", "Lebih memahami "],
+            ["wawasan tentang dunia kerja", "relasi dengan perusahaan mitra", "ilmu baru yang bermanfaat",
+             "pengalaman kunjungan industri", "kepercayaan diri untuk magang", "keterampilan digital marketing",
+             "pemahaman tentang analisis data", "jejaring dengan mahasiswa lain"],
+            ["", ".", " dan relasi baru", ", terutama saat praktik langsung",
+             " yang relevan dengan karier saya", " sehingga lebih siap bekerja"],
+        ],
+        "short": ["Banyak sih", "Menambah wawasan", "ilmu baru", "relasi"],
+    },
+    "dipertahankan": {
+        "parts": [
+            ["", "Menurut saya ", "Sebaiknya dipertahankan ", "Yang terbaik adalah "],
+            ["kunjungan industri ke perusahaan mitra", "sesi praktik langsung", "mentor yang interaktif",
+             "diskusi kelompok", "kesempatan magang", "tim GIK yang solid", "materi yang relevan",
+             "fasilitas kelas yang nyaman"],
+            ["", ".", " karena sangat membantu", " dan suasana kelas yang seru", ", semoga terus ada"],
+        ],
+        "short": ["Semuanya", "Semua sudah baik", "Mentornya", "-"],
+    },
+    "harapan": {
+        "parts": [
+            ["", "Mungkin ", "Semoga ", "Ingin ada ", "Saran saya "],
+            ["topik digital marketing", "kelas analisis data", "lebih banyak sesi praktik",
+             "kunjungan ke industri lain", "pilihan mitra yang lebih beragam", "tugas rutin tiap kelas",
+             "materi public speaking", "simulasi wawancara kerja"],
+            ["", ".", " untuk batch selanjutnya", " agar lebih aplikatif", " dengan durasi yang lebih panjang"],
+        ],
+        "short": ["belum ada", "Tidak ada", "-", "Cukup"],
+    },
+    "alasan_rekomendasi": {
+        "parts": [
+            ["Karena ", "Saya merekomendasikan karena ", "", "Program ini "],
+            ["menambah wawasan dan relasi", "memberikan pengalaman langsung di perusahaan",
+             "sangat bermanfaat untuk persiapan karier", "materinya relevan dengan kebutuhan industri",
+             "bisa membuka peluang magang", "mentornya kompeten"],
+            ["", ".", " bagi mahasiswa tingkat akhir", " dan gratis", ", sangat menginspirasi"],
+        ],
+        "short": ["N/A", "-", "untuk menambah wawasan", "bagus"],
+    },
+    "pengalaman": {
+        "parts": [
+            ["Saat ", "Ketika ", "Pengalaman paling berkesan adalah ", "", "Saya senang "],
+            ["kunjungan industri ke pabrik mitra", "presentasi kelompok di depan mentor",
+             "praktik langsung membuat konten", "diskusi dengan praktisi perusahaan",
+             "sesi wawancara dengan mitra", "mengenal teman dari fakultas lain"],
+            ["", ".", " yang sangat seru", ", banyak ilmu yang didapatkan", " meskipun jadwalnya padat"],
+        ],
+        "short": ["menambah pengetahuan", "-", "Semua berkesan"],
+    },
+    "saran": {
+        "parts": [
+            ["", "Sebaiknya ", "Saran saya ", "Mungkin bisa ", "Tolong "],
+            ["jadwal lebih diperhatikan agar tidak bentrok dengan kuliah", "durasi setiap sesi ditambah",
+             "waktu praktik diperpanjang", "lebih banyak mitra perusahaan", "link zoom dibagikan lebih awal",
+             "mentor memberi evaluasi dan pendampingan lanjutan", "kunjungan lapangan diperbanyak",
+             "fasilitas kelas ditingkatkan"],
+            ["", ".", " supaya lebih optimal", " karena sesi sampai malam", " untuk batch berikutnya"],
+        ],
+        "short": ["sudah baik", "tidak ada", "-", "Pertahankan"],
+    },
+    "tertarik": {
+        "parts": [
+            ["Saya tertarik karena ", "Tertarik karena ", "", "Karena "],
+            ["ingin menambah pengalaman sebelum lulus", "programnya membantu persiapan dunia kerja",
+             "ada kesempatan magang di perusahaan mitra", "ingin belajar langsung dari praktisi",
+             "melihat informasi dari social media GIK", "direkomendasikan oleh teman"],
+            ["", ".", " dan gratis", ", juga menambah relasi"],
+        ],
+        "short": [],
+    },
+}
+
+# Header kolom teks bebas -> nama bank kalimat
+TEXT_COLUMNS = {
+    **{header: short for header, short in EVALUASI_COLUMNS.items() if short in EVALUASI_TEXT_COLUMNS},
+    "Apa yang membuatmu tertarik mengikuti GIKnowledge Building?": "tertarik",
+}
+
+
+# =====================
+# GENERATOR
+# =====================
+def read_sample(name):
+    return pd.read_csv(SAMPLE_DIR / f"{name}.csv")
+
+
+def make_comments(bank, real, n, rng, p_short=0.15, p_real=0.2, p_lower=0.3):
+    """Jawaban terbuka sintetis: campuran kalimat rakitan, jawaban singkat, dan jawaban asli sampel.
+
+    Proporsi jawaban kosong mengikuti kolom sampel.
+    """
+    parts = [np.array(p, dtype=object) for p in bank["parts"]]
+    text = pd.Series(parts[0][rng.integers(0, len(parts[0]), n)])
+    for p in parts[1:]:
+        text = text + p[rng.integers(0, len(p), n)]
+    text = text.str.slice(0, 1).str.upper() + text.str.slice(1)
+
+    kind = rng.random(n)
+    lower = rng.random(n) < p_lower
+    text[lower] = text[lower].str.lower()
+
+    if bank["short"]:
+        short = kind < p_short
+        text[short] = np.array(bank["short"], dtype=object)[rng.integers(0, len(bank["short"]), short.sum())]
+
+    real_values = real.dropna().to_numpy(dtype=object)
+    if len(real_values):
+        use_real = (kind >= p_short) & (kind < p_short + p_real)
+        text[use_real] = real_values[rng.integers(0, len(real_values), use_real.sum())]
+
+    text[rng.random(n) < real.isna().mean()] = np.nan
+    return text
+
+
+def make_timestamps(real, n, rng):
+    # Hari acak dalam rentang sampel, jam-menit-detik diambil dari distribusi sampel
+    real = pd.to_datetime(real)
+    days = pd.date_range(real.min().normalize(), real.max().normalize(), freq="D")
+    day = days[rng.integers(0, len(days), n)]
+    offset = (real - real.dt.normalize()).to_numpy()[rng.integers(0, len(real), n)]
+    ts = pd.Series(day + offset)
+    # Format seperti ekspor Google Form: jam tanpa nol di depan (mis. 2025-06-13 8:00:46)
+    return ts.dt.strftime("%Y-%m-%d %H:%M:%S").str.replace(r" 0(\d):", r" \1:", regex=True)
+
+
+def generate(name, n_rows, seed=0):
+    """Buat `n_rows` baris sintetis dengan header persis sama dengan `data/<name>.csv`.
+
+    Kolom pilihan tertutup di-bootstrap per baris dari sampel (kombinasi
+    fakultas/prodi, jawaban Likert & alasan tetap konsisten); kolom teks bebas
+    dan Timestamp dibangkitkan ulang.
+    """
+    rng = np.random.default_rng(seed)
+    sample = read_sample(name)
+    df = sample.iloc[rng.integers(0, len(sample), n_rows)].reset_index(drop=True)
+
+    for col in df.columns:
+        if col in TEXT_COLUMNS:
+            df[col] = make_comments(TEXT_BANKS[TEXT_COLUMNS[col]], sample[col], n_rows, rng)
+
+    if "Timestamp" in df.columns:
+        df["Timestamp"] = make_timestamps(sample["Timestamp"], n_rows, rng)
+    return df
+
+
+def write_datasets(out_dir, n_rows, seed=0, names=DATASET_NAMES):
+    # Tulis ketiga CSV ke out_dir (pakai sebagai GIK_DATA_DIR)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, name in enumerate(names):
+        path = out_dir / f"{name}.csv"
+        generate(name, n_rows, seed=seed + i).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    # python -m gik.synth --rows 100000 --out /tmp/gik_100k  (dari folder Pages)
+    parser = argparse.ArgumentParser(description="Generator data sintetis GIKnowledge")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for path in write_datasets(args.out, args.rows, args.seed):
+        print(path)
@@ -0,0 +1,103 @@
+import re
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from gik.instrument import timed
+from gik.stopwords import load_stopwords
+
+# =====================
+# KONFIGURASI TOKENISASI
+# =====================
+NON_ALPHA = re.compile(r"[^a-z\s]")  # Hapus simbol & angka
+MIN_TOKEN_LEN = 4                     # Setara filter len(t) > 3
+MEMO_SIZE = 200_000                   # teks unik maksimum di memo token
+
+
+# =====================
+# TOKENIZER
+# =====================
+class Tokenizer:
+    """Tokenizer dengan stopword & regex yang disiapkan sekali.
+
+    Token disimpan per teks respons (memo LRU berkapasitas `memo_size`), jadi
+    jawaban yang sama ("Belum ada", "sudah baik", ...) hanya ditokenisasi satu
+    kali tanpa memo tumbuh terus selama server berjalan.
+    """
+
+    def __init__(self, stop_words=None, min_len=MIN_TOKEN_LEN, memo_size=MEMO_SIZE):
+        if stop_words is None:
+            stop_words = load_stopwords()
+        self.stop_words = frozenset(stop_words)
+        self.min_len = min_len
+        self.memo_size = memo_size
+        self._memo = OrderedDict()
+
+    def tokenize(self, text, memo=True):
+        if pd.isna(text):
+            return []
+        text = str(text)
+        if not memo:
+            return self._tokenize_one(text)
+        tokens = self._memo.get(text)
+        if tokens is None:
+            # Satu teks: regex langsung lebih murah daripada jalur pandas _tokenize_new
+            tokens = self._remember({text: tuple(self._tokenize_one(text))})[text]
+        else:
+            self._memo.move_to_end(text)
+        return list(tokens)
+
+    def _tokenize_one(self, text):
+        # Aturan sama dengan _tokenize_new
+        words = NON_ALPHA.sub(" ", text.lower()).split()
+        return [w for w in words if len(w) >= self.min_len and w not in self.stop_words]
+
+    @timed("tokenize")
+    def tokenize_series(self, series):
+        # Hasil: Series tuple token dengan index yang sama; nilai kosong -> tuple kosong
+        mask = series.notna().to_numpy()
+        texts = series[mask].astype(str)
+        found = self._lookup(texts.unique())
+
+        out = np.empty(len(series), dtype=object)
+        out.fill(())
+        out[mask] = texts.map(found).to_numpy()
+        return pd.Series(out, index=series.index)
+
+    def _lookup(self, texts):
+        # {teks: token} untuk teks unik; yang belum ada di memo ditokenisasi sekaligus
+        found, missing = {}, []
+        for text in texts:
+            tokens = self._memo.get(text)
+            if tokens is None:
+                missing.append(text)
+            else:
+                self._memo.move_to_end(text)
+                found[text] = tokens
+        found.update(self._tokenize_new(missing))
+        return found
+
+    def _tokenize_new(self, texts):
+        if not texts:
+            return {}
+        raw = pd.Series(texts, dtype=object)
+        words = (
+            raw.str.lower()
+            .str.replace(NON_ALPHA, " ", regex=True)
+            .str.split()
+            .explode()
+            .dropna()
+        )
+        keep = words[(words.str.len() >= self.min_len) & ~words.isin(self.stop_words)]
+        # explode() menjaga urutan posisi teks -> batas token tiap teks cukup dicari dengan searchsorted
+        bounds = np.searchsorted(keep.index.to_numpy(), np.arange(len(texts) + 1)).tolist()
+        values = keep.tolist()
+        return self._remember({text: tuple(values[bounds[i]:bounds[i + 1]]) for i, text in enumerate(texts)})
+
+    def _remember(self, new):
+        self._memo.update(new)
+        # Buang teks yang paling lama tidak dipakai
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return new
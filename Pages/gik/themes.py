@@ -0,0 +1,86 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from gik.instrument import timed
+from gik.keywords import THEME_MAP
+
+
+# =====================
+# MODEL TEMA (SPARSE)
+# =====================
+class ThemeModel:
+    """Penugasan tema per responden dari matriks dokumen-kata sparse.
+
+    - `dtm`: CSR responden x kosakata (jumlah token bersih)
+    - `scores`: TF-IDF (idf halus, baris dinormalisasi L2) x keanggotaan
+      kata kunci-tema -> skor responden x tema
+    - `labels`: indeks tema dengan skor tertinggi per responden (-1 = tanpa tema)
+
+    Dibangun sekali per versi dataset; semua ringkasan dibaca dari matriks ini.
+    """
+
+    @timed("tema.dtm")
+    def __init__(self, token_lists, theme_map=THEME_MAP):
+        self.themes = list(theme_map)
+        self.theme_map = theme_map
+        lengths = np.fromiter((len(t) for t in token_lists), dtype=np.int64, count=len(token_lists))
+        codes, self.vocabulary = pd.factorize(
+            np.fromiter(itertools.chain.from_iterable(token_lists), dtype=object, count=int(lengths.sum()))
+        )
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        self.dtm = sparse.csr_matrix(
+            (np.ones(len(codes), dtype=np.int32), codes, indptr),
+            shape=(len(lengths), len(self.vocabulary))
+        )
+        self.dtm.sum_duplicates()
+
+        # Keanggotaan kosakata x tema (kata kunci yang tidak pernah muncul diabaikan)
+        term_id = pd.Index(self.vocabulary)
+        rows, cols = [], []
+        for t, keywords in enumerate(theme_map.values()):
+            for k in keywords:
+                pos = term_id.get_indexer([k])[0]
+                if pos >= 0:
+                    rows.append(pos)
+                    cols.append(t)
+        self.membership = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(self.vocabulary), len(self.themes))
+        )
+
+        # TF-IDF (rumus sama dengan TfidfTransformer scikit-learn: smooth_idf, norm="l2")
+        n_docs = self.dtm.shape[0]
+        doc_freq = np.bincount(self.dtm.indices, minlength=self.dtm.shape[1])
+        idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+        tfidf = self.dtm.multiply(idf).tocsr()
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        tfidf = sparse.diags(1 / norms) @ tfidf
+
+        self.scores = np.asarray((tfidf @ self.membership).todense())
+        best = self.scores.argmax(axis=1)
+        self.labels = np.where(self.scores.max(axis=1, initial=0) > 0, best, -1)
+
+    def keyword_totals(self):
+        # Total kemunculan tiap kata kunci tema di seluruh responden
+        totals = np.asarray(self.dtm.sum(axis=0)).ravel()
+        term_id = pd.Index(self.vocabulary)
+        return {
+            k: int(totals[pos]) if pos >= 0 else 0
+            for keywords in self.theme_map.values()
+            for k, pos in zip(keywords, term_id.get_indexer(keywords))
+        }
+
+    def volumes(self):
+        # Jumlah responden per label tema
+        counts = np.bincount(self.labels[self.labels >= 0], minlength=len(self.themes))
+        return dict(zip(self.themes, counts.tolist()))
+
+    def top_rows(self, theme, n=3):
+        # Posisi responden berlabel `theme` dengan skor tertinggi (seri -> urutan data)
+        t = self.themes.index(theme)
+        rows = np.flatnonzero(self.labels == t)
+        order = np.argsort(-self.scores[rows, t], kind="stable")
+        return rows[order[:n]]
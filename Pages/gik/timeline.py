@@ -0,0 +1,179 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+NS_PER_HOUR = 3_600 * 10**9
+
+# Lebar bucket (jam) per granularitas; minggu dimulai Senin (1970-01-05 = jam ke-96)
+BUCKET_HOURS = {"jam": 1, "hari": 24, "minggu": 168}
+_BUCKET_SHIFT = {"jam": 0, "hari": 0, "minggu": 72}
+
+
+def to_day(date):
+    # Tanggal -> nomor hari sejak epoch (1970-01-01)
+    return int(np.datetime64(date, "D").astype(np.int64))
+
+
+def from_day(day):
+    return datetime.date(1970, 1, 1) + datetime.timedelta(days=int(day))
+
+
+def from_hour(hour):
+    return datetime.datetime(1970, 1, 1) + datetime.timedelta(hours=int(hour))
+
+
+# =====================
+# DAILY COUNTS (PREFIX SUM)
+# =====================
+class DailyCounts:
+    """Jumlah per hari dalam array padat + prefix sum.
+
+    Total, hari terpadat dan deret tren untuk rentang tanggal apa pun dibaca
+    dari potongan array O(jumlah hari), bukan dari baris pendaftar.
+    """
+
+    def __init__(self, first_day, counts):
+        self.first_day = int(first_day)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.prefix = np.concatenate([[0], np.cumsum(self.counts)])
+
+    @classmethod
+    def from_days(cls, days, weights=None, first_day=None, n_days=None):
+        days = np.asarray(days, dtype=np.int64)
+        if first_day is None:
+            first_day = days.min() if len(days) else 0
+        if n_days is None:
+            n_days = int(days.max() - first_day + 1) if len(days) else 0
+        counts = np.bincount(days - first_day, weights=weights, minlength=n_days)
+        return cls(first_day, counts.astype(np.int64))
+
+    @property
+    def min_date(self):
+        return from_day(self.first_day)
+
+    @property
+    def max_date(self):
+        return from_day(self.first_day + len(self.counts) - 1)
+
+    def _bounds(self, date_start, date_end):
+        # Offset [a, b) yang sudah dipotong ke rentang data
+        a = max(to_day(date_start) - self.first_day, 0)
+        b = min(to_day(date_end) - self.first_day + 1, len(self.counts))
+        return a, max(a, b)
+
+    def total(self, date_start, date_end):
+        a, b = self._bounds(date_start, date_end)
+        return int(self.prefix[b] - self.prefix[a])
+
+    def busiest_day(self, date_start, date_end):
+        # Hari dengan pendaftar terbanyak; jika seri, ambil tanggal paling awal
+        a, b = self._bounds(date_start, date_end)
+        if b == a or self.prefix[b] == self.prefix[a]:
+            return None
+        return from_day(self.first_day + a + int(np.argmax(self.counts[a:b])))
+
+    def series(self, date_start, date_end):
+        # Deret harian (hanya hari yang ada pendaftar), index = tanggal
+        a, b = self._bounds(date_start, date_end)
+        window = self.counts[a:b]
+        offsets = np.flatnonzero(window)
+        dates = [from_day(self.first_day + a + int(o)) for o in offsets]
+        return pd.Series(window[offsets], index=pd.Index(dates, dtype=object), name="count")
+
+
+# =====================
+# HOURLY COUNTS (SEMUA GRANULARITAS)
+# =====================
+class HourlyCounts:
+    """Jumlah per jam dalam array padat, sumber semua deret waktu.
+
+    Deret per jam/hari/minggu, kumulatif, rata-rata bergulir, jam tersibuk dan
+    DailyCounts (total & hari terpadat) diturunkan dari array ini, jadi biayanya
+    sebanding jumlah jam dalam rentang, bukan jumlah pendaftar.
+    """
+
+    def __init__(self, first_hour, counts):
+        self.first_hour = int(first_hour)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self._daily = None
+
+    @classmethod
+    def from_hours(cls, hours, weights=None, first_hour=None, n_hours=None):
+        hours = np.asarray(hours, dtype=np.int64)
+        if first_hour is None:
+            first_hour = hours.min() if len(hours) else 0
+        if n_hours is None:
+            n_hours = int(hours.max() - first_hour + 1) if len(hours) else 0
+        counts = np.bincount(hours - first_hour, weights=weights, minlength=n_hours)
+        return cls(first_hour, counts.astype(np.int64))
+
+    @property
+    def min_date(self):
+        return from_day(self.first_hour // 24)
+
+    @property
+    def max_date(self):
+        return from_day((self.first_hour + len(self.counts) - 1) // 24)
+
+    def daily(self):
+        # Jumlah per hari (array jam dipotong per 24), dihitung sekali per objek
+        if self._daily is None:
+            first_day = self.first_hour // 24
+            offset = self.first_hour - first_day * 24
+            n_days = -(-(offset + len(self.counts)) // 24)
+            padded = np.zeros(n_days * 24, dtype=np.int64)
+            padded[offset:offset + len(self.counts)] = self.counts
+            self._daily = DailyCounts(first_day, padded.reshape(-1, 24).sum(axis=1))
+        return self._daily
+
+    def _window(self, date_start, date_end):
+        # Offset jam [a, b) untuk rentang tanggal inklusif, dipotong ke rentang data
+        a = max(to_day(date_start) * 24 - self.first_hour, 0)
+        b = min((to_day(date_end) + 1) * 24 - self.first_hour, len(self.counts))
+        return a, max(a, b)
+
+    def buckets(self, granularity, date_start, date_end):
+        """(jam awal tiap bucket, jumlah) padat untuk granularitas "jam"/"hari"/"minggu".
+
+        Bucket di tepi rentang hanya menghitung jam di dalam rentang.
+        """
+        a, b = self._window(date_start, date_end)
+        size, shift = BUCKET_HOURS[granularity], _BUCKET_SHIFT[granularity]
+        if b == a:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        if size == 1:
+            return self.first_hour + np.arange(a, b), self.counts[a:b]
+        keys = (self.first_hour + np.arange(a, b) + shift) // size
+        counts = np.bincount(keys - keys[0], weights=self.counts[a:b]).astype(np.int64)
+        return (keys[0] + np.arange(len(counts))) * size - shift, counts
+
+    def hour_of_day(self, date_start, date_end):
+        # Jumlah per jam dalam sehari (0-23) untuk rentang tanggal
+        a, b = self._window(date_start, date_end)
+        hours = (self.first_hour + np.arange(a, b)) % 24
+        return np.bincount(hours, weights=self.counts[a:b], minlength=24).astype(np.int64)
+
+
+# =====================
+# TIMELINE (TIMESTAMP TERURUT)
+# =====================
+class Timeline(HourlyCounts):
+    """Timestamp pendaftar (int64 nanodetik, terurut) + jumlah per jam.
+
+    `hours` = nomor jam per baris, dipakai sebagai dimensi waktu CountCube.
+    """
+
+    def __init__(self, timestamps):
+        ts = pd.Series(timestamps).to_numpy(dtype="datetime64[ns]").view(np.int64)
+        if len(ts) and np.any(ts[1:] < ts[:-1]):
+            raise ValueError("Timestamp harus terurut naik")
+        self.ts = ts
+        hours = ts // NS_PER_HOUR
+        first_hour = hours[0] if len(hours) else 0
+        counts = np.bincount(hours - first_hour) if len(hours) else np.zeros(0, dtype=np.int64)
+        super().__init__(first_hour, counts)
+
+    @property
+    def hours(self):
+        return self.ts // NS_PER_HOUR
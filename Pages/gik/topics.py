@@ -0,0 +1,256 @@
+import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from gik.dedup import normalize
+from gik.ingest import CACHE_DIR, _read_meta, _write_atomic, _write_meta
+from gik.instrument import stage
+from gik.text import Tokenizer
+
+# =====================
+# KONFIGURASI MODEL TOPIK
+# =====================
+FORMAT = 1                # naikkan jika isi model berubah -> model lama dilatih ulang
+N_TOPICS = 8
+N_FEATURES = 2 ** 16      # kolom fitur hashing (tanpa kosakata tetap)
+BATCH_SIZE = 4_096        # dokumen per panggilan partial_fit
+N_TERMS = 8
+N_COMMENTS = 3
+POOL_SIZE = 20            # kandidat komentar representatif yang disimpan per topik
+MODEL_PATH = CACHE_DIR / "topics.joblib"
+SUMMARY_PATH = CACHE_DIR / "topics.json"
+
+
+def _vectorizer(n_features):
+    # Stateless: dokumen sudah berupa daftar token bersih
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(
+        n_features=n_features, analyzer=lambda tokens: tokens, alternate_sign=False, norm=None
+    )
+
+
+def document_keys(df, columns):
+    """Kunci uint64 stabil per (kolom, baris) dari hash isi baris -> array kolom x baris.
+
+    Baris identik diberi nomor urut kemunculan, jadi data gelombang berikutnya
+    yang ditambahkan ke CSV hanya menghasilkan kunci baru untuk baris barunya.
+    """
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    occurrence = pd.Series(hashes).groupby(hashes).cumcount().to_numpy()
+    return np.stack([
+        pd.util.hash_pandas_object(
+            pd.DataFrame({"baris": hashes, "ke": occurrence, "kolom": col}), index=False
+        ).to_numpy()
+        for col in columns
+    ])
+
+
+# =====================
+# MODEL TOPIK INKREMENTAL
+# =====================
+class TopicModel:
+    """Klaster topik jawaban terbuka dengan MiniBatchKMeans yang diperbarui bertahap.
+
+    - Fitur: hashing token bersih (tf sublinear, baris dinormalisasi L2), jadi
+      dokumen baru tidak memerlukan kosakata ulang.
+    - `partial_fit` hanya memproses dokumen yang kuncinya belum pernah dilihat
+      (gelombang survei baru), lalu memperbarui ukuran topik & kandidat komentar.
+    - Kata teratas dibaca dari centroid lewat peta kata -> kolom hashing.
+    """
+
+    def __init__(self, n_topics=N_TOPICS, n_features=N_FEATURES, seed=0):
+        from sklearn.cluster import MiniBatchKMeans
+
+        self.format = FORMAT
+        self.n_topics = n_topics
+        self.n_features = n_features
+        self.kmeans = MiniBatchKMeans(n_clusters=n_topics, random_state=seed, batch_size=BATCH_SIZE)
+        self.fitted = False
+        self.terms = {}
+        self.sizes = np.zeros(n_topics, dtype=np.int64)
+        self.pool = []        # teks kandidat komentar representatif (semua topik)
+        self.seen = np.zeros(0, dtype=np.uint64)   # kunci dokumen yang sudah diproses (terurut)
+        self.n_docs = 0
+
+    def _features(self, token_lists):
+        from sklearn.preprocessing import normalize as l2_normalize
+
+        X = _vectorizer(self.n_features).transform(token_lists)
+        X.data = 1 + np.log(X.data)
+        return l2_normalize(X)
+
+    def _learn_terms(self, token_lists):
+        new = list(dict.fromkeys(t for tokens in token_lists for t in tokens if t not in self.terms))
+        if new:
+            columns = _vectorizer(self.n_features).transform([[t] for t in new]).indices
+            self.terms.update(zip(new, columns.tolist()))
+
+    def partial_fit(self, keys, texts, tokenizer):
+        """Perbarui model dengan dokumen (kunci uint64, teks) yang belum pernah dilihat.
+
+        Mengembalikan jumlah dokumen baru yang dipakai. Dokumen tanpa token
+        bersih (mis. "Tidak ada") ditandai terlihat tetapi tidak dilatih.
+        """
+        fresh = ~np.isin(keys, self.seen)
+        if not fresh.any():
+            return 0
+        keys = keys[fresh]
+        texts = [t for t, new in zip(texts, fresh.tolist()) if new]
+        tokens = tokenizer.tokenize_series(pd.Series(texts, dtype=object)).tolist()
+        useful = [i for i, t in enumerate(tokens) if t]
+        # Inisialisasi k-means++ butuh minimal n_topics dokumen; tunggu gelombang berikutnya
+        if not self.fitted and len(useful) < self.n_topics:
+            return 0
+
+        with stage("topik.partial_fit", rows=len(useful)):
+            token_lists = [tokens[i] for i in useful]
+            X = self._features(token_lists)
+            for start in range(0, X.shape[0], BATCH_SIZE):
+                self.kmeans.partial_fit(X[start:start + BATCH_SIZE])
+            self.fitted = self.fitted or X.shape[0] > 0
+            self._learn_terms(token_lists)
+            if X.shape[0]:
+                self.sizes += np.bincount(self.kmeans.predict(X), minlength=self.n_topics)
+            self._refresh_pool([texts[i] for i in useful], tokenizer)
+
+        self.seen = np.union1d(self.seen, keys)
+        self.n_docs += len(useful)
+        return len(useful)
+
+    def _assign(self, texts, tokenizer):
+        # Topik & jarak ke centroid untuk teks yang pasti punya token bersih
+        X = self._features([tokenizer.tokenize(t, memo=False) for t in texts])
+        labels = self.kmeans.predict(X)
+        return labels, self.kmeans.transform(X)[np.arange(len(texts)), labels]
+
+    def _refresh_pool(self, texts, tokenizer):
+        # Kandidat lama + dokumen baru dinilai ulang terhadap centroid terbaru
+        candidates = list(dict.fromkeys(self.pool + texts))
+        labels, distance = self._assign(candidates, tokenizer)
+
+        pool = []
+        for topic in range(self.n_topics):
+            rows = np.flatnonzero(labels == topic)
+            picked = {}
+            for i in rows[np.argsort(distance[rows], kind="stable")].tolist():
+                # Satu wakil per teks ter-normalisasi, agar komentar kembar tidak mengisi semua slot
+                picked.setdefault(normalize(candidates[i]), candidates[i])
+                if len(picked) == POOL_SIZE:
+                    break
+            pool.extend(picked.values())
+        self.pool = pool
+
+    def summary(self, tokenizer=None):
+        """Ringkasan siap tampil: label, kata teratas, ukuran & komentar per topik."""
+        tokenizer = tokenizer or Tokenizer()
+        if not self.fitted:
+            return []
+        centers = self.kmeans.cluster_centers_
+        terms = list(self.terms)
+        columns = np.fromiter(self.terms.values(), dtype=np.int64, count=len(terms))
+
+        labels, distance = self._assign(self.pool, tokenizer)
+
+        topics = []
+        for topic in range(self.n_topics):
+            weights = centers[topic, columns]
+            order = np.argsort(-weights, kind="stable")[:N_TERMS]
+            top_terms = [terms[i] for i in order.tolist() if weights[i] > 0]
+            rows = np.flatnonzero(labels == topic)
+            rows = rows[np.argsort(distance[rows], kind="stable")][:N_COMMENTS]
+            topics.append({
+                "id": topic,
+                "label": " / ".join(top_terms[:3]) or "(tanpa kata)",
+                "kata": top_terms,
+                "jumlah": int(self.sizes[topic]),
+                "komentar": [self.pool[i] for i in rows.tolist()],
+            })
+        return sorted(topics, key=lambda t: -t["jumlah"])
+
+    def save(self, path=MODEL_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, lambda tmp: joblib.dump(self, tmp))
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        # Model hilang/rusak/format lama -> None (dilatih ulang dari seluruh data)
+        try:
+            model = joblib.load(path)
+        except Exception:
+            return None
+        return model if getattr(model, "format", None) == FORMAT else None
+
+
+# =====================
+# API
+# =====================
+def cached_summary(source, summary_path=SUMMARY_PATH):
+    # Ringkasan tersimpan bila dibuat dari `source` (mis. versi dataset) yang sama, tanpa memuat model
+    cached = _read_meta(summary_path)
+    if source is not None and cached.get("format") == FORMAT and cached.get("source") == source:
+        return cached
+    return None
+
+
+def update_topics(keys, texts, tokenizer=None, source=None,
+                  model_path=MODEL_PATH, summary_path=SUMMARY_PATH):
+    """Latih model tersimpan dengan dokumen yang belum pernah dilihat, kembalikan ringkasannya.
+
+    `keys`/`texts` = kunci uint64 & teks per dokumen (lihat `document_keys`).
+    Model dimuat (atau dibuat) lalu hanya dokumen baru yang dipakai. Jika ada
+    dokumen terlatih yang tidak lagi ada di data (baris diubah/dihapus), model
+    dilatih ulang dari awal agar ukuran & contoh topik sesuai data. Model &
+    ringkasan JSON disimpan atomik bila ada perubahan; ringkasan tanpa `source`
+    tidak ditulis agar tidak menimpa ringkasan per versi dataset milik halaman.
+    """
+    cached = _read_meta(summary_path)
+    tokenizer = tokenizer or Tokenizer()
+    model = TopicModel.load(model_path)
+    refit = model is not None and not np.isin(model.seen, keys).all()
+    if model is None or refit:
+        model = TopicModel()
+    if model.partial_fit(keys, texts, tokenizer) or refit or not cached or cached.get("source") != source:
+        summary = {
+            "format": FORMAT,
+            "source": source,
+            "updated": datetime.datetime.now().isoformat(timespec="seconds"),
+            "dokumen": model.n_docs,
+            "topik": model.summary(tokenizer),
+        }
+        model.save(model_path)
+        if source is not None:
+            summary_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_meta(summary_path, summary)
+        return summary
+    return cached
+
+
+def main(argv=None):
+    import argparse
+
+    from gik.analytics.evaluasi import topic_documents
+    from gik.datasets import load_evaluasi
+    from gik.ingest import dataset_version
+
+    parser = argparse.ArgumentParser(
+        prog="python -m gik.topics",
+        description="Perbarui model topik jawaban terbuka dengan respons yang belum diproses."
+    )
+    parser.add_argument("--reset", action="store_true", help="hapus model lama dan latih ulang dari awal")
+    args = parser.parse_args(argv)
+
+    if args.reset:
+        MODEL_PATH.unlink(missing_ok=True)
+        SUMMARY_PATH.unlink(missing_ok=True)
+    before = _read_meta(SUMMARY_PATH).get("dokumen", 0)
+    summary = update_topics(*topic_documents(load_evaluasi()), source=dataset_version("data_evaluasi"))
+    print(f"{summary['dokumen'] - before} dokumen baru, total {summary['dokumen']} -> {SUMMARY_PATH}")
+    for topic in summary["topik"]:
+        print(f"  [{topic['jumlah']:>6}] {topic['label']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import os
+
+import streamlit as st
+
+
+# =====================
+# PANEL DEBUG
+# =====================
+def debug_enabled():
+    # Aktif lewat env GIK_DEBUG=1 atau query param ?debug=1
+    if os.environ.get("GIK_DEBUG", "").lower() in ("1", "true", "yes"):
+        return True
+    return st.query_params.get("debug", "").lower() in ("1", "true", "yes")
+
+
+def debug_panel(recorder):
+    """Panggil di akhir script: (jika debug aktif) tampilkan tabel tahap di sidebar.
+
+    Log JSONL sudah ditulis Recorder setiap tahap teratas selesai.
+    """
+    if not debug_enabled():
+        return
+
+    with st.sidebar.expander("⏱️ Debug: Waktu per Tahap"):
+        st.dataframe(recorder.table(), hide_index=True, use_container_width=True)
+        st.caption(f"Total tahap tercatat: {recorder.total_seconds():.3f} detik · run `{recorder.run_id}`")
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Paket gik ada di folder Pages (halaman Streamlit dijalankan dari sana)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "Pages"))
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from gik.ingest import DATA_DIR
+from gik.jenjang import JENJANG_LEVELS, classify_jenjang, derive_jenjang
+
+
+def reference(prodi, fakultas=None):
+    # Versi per baris lama; fakultas kosong (NaN) diperlakukan seperti tidak ada
+    if fakultas is None:
+        fakultas = pd.Series(None, index=prodi.index, dtype=object)
+    return pd.Series(
+        [derive_jenjang(p, f if isinstance(f, str) else None) for p, f in zip(prodi, fakultas)],
+        index=prodi.index, dtype=object
+    )
+
+
+def assert_same(prodi, fakultas=None):
+    actual = classify_jenjang(prodi, fakultas)
+    assert list(actual.cat.categories) == JENJANG_LEVELS
+    pd.testing.assert_series_equal(actual.astype(object), reference(prodi, fakultas))
+
+
+@pytest.mark.parametrize("title", [False, True])
+def test_sample_data_matches_reference(title):
+    df = pd.read_csv(DATA_DIR / "data_peserta.csv")
+    df.columns = df.columns.str.strip()
+    for col in ["Fakultas/Sekolah Asal", "Prodi Asal"]:
+        df[col] = df[col].astype(str).str.strip()
+        if title:
+            # Bentuk setelah prepare_peserta
+            df[col] = df[col].str.title()
+    assert_same(df["Prodi Asal"], df["Fakultas/Sekolah Asal"])
+
+
+def test_edge_rows_match_reference():
+    prodi = pd.Series([
+        None, "nan", "", "S1 Biologi", "s1 biologi", "SARJANA Terapan", "Program Magister",
+        "MASTER of Science", "s2 teknik sipil", "D4 Agroindustri", "d3 akuntansi",
+        "Teknik Sipil", "Doktor Ilmu Hukum", " S1 Hukum", "Diploma", "Magister Sarjana",
+    ], dtype=object)
+    fakultas = pd.Series([
+        "Sekolah Vokasi", None, "SEKOLAH VOKASI", None, "teknik", "", "Vokasi",
+        "Hukum", float("nan"), None, "sekolah vokasi", "Teknik", "nan", "Hukum", "Lainnya", "",
+    ], dtype=object)
+    assert_same(prodi, fakultas)
+    assert_same(prodi)
+
+
+def test_empty_series():
+    assert classify_jenjang(pd.Series([], dtype=object)).empty
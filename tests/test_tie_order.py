@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from gik import sqlstore
+from gik.analytics import pendaftar, peserta
+from gik.datasets import SEMESTER_COL
+from gik.schema import value_counts
+
+# Setiap instansi muncul dua kali (seri), kecuali "Zeta" sekali.
+# Urutan kemunculan pertama menurut waktu: Gamma, Alpha, Beta, Zeta
+INSTANSI = ["Gamma", "Alpha", "Gamma", "Beta", "Alpha", "Zeta", "Beta"]
+EXPECTED = ["Gamma", "Alpha", "Beta", "Zeta"]
+
+
+@pytest.fixture
+def pendaftar_df():
+    n = len(INSTANSI)
+    return pd.DataFrame({
+        "Timestamp": pd.date_range("2025-07-01 08:00", periods=n, freq="5h"),
+        "Asal Instansi": INSTANSI,
+        "Jenjang pendidikan asal": ["S1"] * n,
+        "Jenis kelamin": ["Perempuan", "Laki-laki"] * 3 + ["Perempuan"],
+        SEMESTER_COL: ["Semester 5"] * n,
+    })
+
+
+@pytest.fixture
+def sql_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlstore, "CACHE_DIR", tmp_path)
+
+
+def test_value_counts_ties_follow_first_occurrence():
+    series = pd.Series(INSTANSI, name="Asal Instansi")
+    for values in (series, series.astype("category")):
+        counts = value_counts(values)
+        assert counts.index.tolist() == EXPECTED
+        assert counts.tolist() == [2, 2, 2, 1]
+
+
+def test_pendaftar_backends_agree_on_ties(pendaftar_df, sql_cache):
+    timeline = pendaftar.build_timeline(pendaftar_df)
+    cube = pendaftar.build_cube(pendaftar_df, timeline)
+    table = pendaftar.build_sql_table(pendaftar_df)
+
+    for backend in (cube, table):
+        counts = backend.counts("Asal Instansi", {})
+        assert counts.index.tolist() == EXPECTED
+        assert counts.tolist() == [2, 2, 2, 1]
+        # Filter gender + rentang tanggal: Alpha & Beta seri (1), Alpha muncul lebih dulu
+        between = pendaftar.date_bounds(timeline.min_date, timeline.max_date)
+        filtered = backend.counts("Asal Instansi", {"Jenis kelamin": "Perempuan"}, between)
+        assert filtered.index.tolist() == ["Gamma", "Alpha", "Beta"]
+        assert filtered.tolist() == [2, 1, 1]
+
+    # KPI ikut pemenang seri yang sama di kedua backend
+    for backend in (cube, table):
+        daily = pendaftar.hourly_counts(backend, timeline, {}).daily()
+        summary = pendaftar.kpis(backend, daily, {}, timeline.min_date, timeline.max_date)
+        assert summary["instansi_terbanyak"] == "Gamma"
+
+
+def test_peserta_backends_agree_on_ties(sql_cache):
+    df = pd.DataFrame({
+        "Asal Instansi": INSTANSI,
+        "Jenjang": ["S1", "S2", "S2", "S1", "Vokasi", "Vokasi", "S1"],
+        "Tahun Angkatan": ["Semester 5"] * len(INSTANSI),
+    })
+    frame = peserta.frame_counts(peserta.build_filter_index(df).select(df, {}))
+    table = peserta.build_sql_table(df)
+    for col in peserta.FILTER_COLUMNS:
+        expected = frame(col)
+        actual = table.counts(col, {})
+        assert actual.index.tolist() == expected.index.tolist()
+        assert actual.tolist() == expected.tolist()
+    assert frame("Asal Instansi").index.tolist() == EXPECTED
+    assert frame("Jenjang").index.tolist() == ["S1", "S2", "Vokasi"]